@@ -1,6 +1,11 @@
-import uvloop
+import asyncio
 import logging
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from src.core import Foggle
 
 async def main():
@@ -13,4 +18,7 @@ async def main():
     await Foggle().run()
 
 if __name__ == "__main__":
-    uvloop.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,19 +1,31 @@
 import os
+import sys
 import importlib
-import inspect
 import asyncio
 import logging
 
 from typing import Dict, List, Any, Optional, Type
 from asyncio.tasks import Task
-from src.exchanges.base import Exchange
+from src.exchanges.base import Exchange, get_exchange_class
+
+_LOGGER = logging.getLogger("api_manager")
+
+_MODULE_CACHE: Dict[str, Any] = {}
+
+
+def _cached_import(module_path: str):
+    module = _MODULE_CACHE.get(module_path)
+    if module is None:
+        module = sys.modules.get(module_path) or importlib.import_module(module_path)
+        _MODULE_CACHE[module_path] = module
+    return module
 
 
 class APIManager:
     
     def __init__(self):
         self._tasks: List[Task] = []
-        self._logger = logging.getLogger("api_manager")
+        self._logger = _LOGGER
 
         self.exchanges: Dict[str, Exchange] = {}
         
@@ -35,25 +47,28 @@ class APIManager:
             self._logger.error(f"Exchanges path {exchanges_path} does not exist")
             return
 
-        for folder in os.listdir(exchanges_path):
-            folder_path = os.path.join(exchanges_path, folder)
-
-            if folder.startswith('__') or folder.startswith('.') or not os.path.isdir(folder_path):
-                continue
-            
-            available_modules[folder.lower()] = f"src.exchanges.{folder}"
-            
-            for item in os.listdir(folder_path):
-                if not item.endswith('.py') or item.startswith('__') or item.startswith('.'):
+        with os.scandir(exchanges_path) as folders:
+            for folder in folders:
+                if folder.name.startswith('__') or folder.name.startswith('.') or not folder.is_dir():
                     continue
-                
-                module_name = item[:-3]
-                module_path = f"src.exchanges.{folder}.{module_name}"
-                available_modules[module_name.lower()] = module_path
-                available_modules[f"{folder.lower()}.{module_name.lower()}"] = module_path
-                
-                module_to_path[module_name.lower()] = folder.lower()
+
+                folder_name = folder.name.lower()
+                available_modules[folder_name] = f"src.exchanges.{folder.name}"
+
+                with os.scandir(folder.path) as items:
+                    for item in items:
+                        if not item.name.endswith('.py') or item.name.startswith('__') or item.name.startswith('.'):
+                            continue
+
+                        module_name = item.name[:-3]
+                        module_path = f"src.exchanges.{folder.name}.{module_name}"
+                        available_modules[module_name.lower()] = module_path
+                        available_modules[f"{folder_name}.{module_name.lower()}"] = module_path
+
+                        module_to_path[module_name.lower()] = folder_name
         
+        pending = []
+
         for exchange_name, exchange_config in config.items():
             if not isinstance(exchange_config, dict) or exchange_config.get('type') != 'EXCHANGE':
                 continue
@@ -73,34 +88,30 @@ class APIManager:
                 continue
             
             try:
-                module = importlib.import_module(module_path)
-                
-                exchange_class = None
-                candidates = [module_name.upper(), exchange_name.upper()]
-                
-                for name, obj in inspect.getmembers(module):
-                    if inspect.isclass(obj) and (obj.__module__ == module_path or obj.__module__.startswith(f"{module_path}.")):
-                        if name.upper() in candidates:
-                            exchange_class = obj
-                            break
-                
-                exchange = exchange_class()
+                _cached_import(module_path)
                 
-                if asyncio.iscoroutinefunction(getattr(exchange, "connectAsync", None)):
-                    await exchange.connectAsync(exchange_config)
-                elif asyncio.iscoroutinefunction(getattr(exchange, "connect", None)):
-                    await exchange.connect(exchange_config)
-                elif hasattr(exchange, "connect"):
-                    exchange.connect(exchange_config)
-                else:
-                    self._logger.warning(f"Exchange {exchange_name} does not have a connect method")
+                exchange_class = (get_exchange_class(module_name.rsplit('.', 1)[-1])
+                                  or get_exchange_class(exchange_name))
+                if exchange_class is None:
+                    self._logger.error(f"No exchange registered for module '{module_name}' ({exchange_name}).")
                     continue
                 
-                self.exchanges[exchange_name] = exchange
+                pending.append((exchange_name, exchange_class(), exchange_config))
                 
             except Exception as e:
                 self._logger.error(f"Error loading exchange {exchange_name}: {e}", exc_info=True)
-    
+
+        results = await asyncio.gather(
+            *[exchange.connectAsync(exchange_config) for _, exchange, exchange_config in pending],
+            return_exceptions=True
+        )
+
+        for (exchange_name, exchange, _), result in zip(pending, results):
+            if isinstance(result, BaseException):
+                self._logger.error(f"Error connecting to exchange {exchange_name}: {result}", exc_info=result)
+            else:
+                self.exchanges[exchange_name] = exchange
+
     async def _monitor_exchanges(self):
         pass
     
@@ -109,10 +120,10 @@ class APIManager:
         
         for name, exchange in self.exchanges.items():
             try:
-                if asyncio.iscoroutinefunction(getattr(exchange, "disconnect", None)):
-                    await exchange.disconnect()
-                elif hasattr(exchange, "disconnect"):
+                if exchange.SYNC_DISCONNECT:
                     exchange.disconnect()
+                else:
+                    await exchange.disconnect()
             except Exception as e:
                 self._logger.error(f"Error disconnecting from {name}: {e}")
         
@@ -2,10 +2,11 @@ import os
 import asyncio
 import signal
 import logging
+import functools
 import yaml
 
 from dotenv import load_dotenv
-from typing import Dict
+from typing import Dict, Optional
 
 from src.api_manager import APIManager
 from src.store.timescaledb.db import Database
@@ -13,18 +14,37 @@ from src.stream import Stream
 from src.feed import Feed
 from src.newswatch.trading_econ import TradingEconomics
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+load_dotenv(dotenv_path='.env')
+
+_SHUTDOWN_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
 
 class Foggle:
     def __init__(self):
         self._shutdown_event = asyncio.Event()
-        for sig in (signal.SIGTERM, signal.SIGINT):
-            signal.signal(sig, self._handle_sigterm)
-            
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Handlers replaced via signal.signal where the loop has no add_signal_handler (e.g. Windows)
+        self._prev_handlers: Dict[int, object] = {}
+
         self.api_manager = APIManager()
 
         logging.info(f"Process ID: {os.getpid()}")
 
     async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        for sig in _SHUTDOWN_SIGNALS:
+            try:
+                self._loop.add_signal_handler(sig, self._shutdown_event.set)
+            except NotImplementedError:
+                self._prev_handlers[sig] = signal.signal(
+                    sig, lambda *_: self._loop.call_soon_threadsafe(self._shutdown_event.set)
+                )
+
         config = load_config()
 
         feed = Feed()
@@ -43,56 +63,38 @@ class Foggle:
         }
         te = TradingEconomics(topics=topics, callback=db.insert_news_item)
 
-        await self._wait_for_confirmation()
-
         await test(streams, te, db)
 
         try:
-            task = asyncio.create_task(self.run_forever())
             await self._shutdown_event.wait()
-
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                logging.info("Shutting down...")
-                
+            logging.info("Shutting down...")
         finally:
             await self.shutdown()
 
     async def shutdown(self) -> None:
+        if self._loop is not None:
+            # Restore default handling so a second signal can still interrupt a stuck shutdown
+            for sig in _SHUTDOWN_SIGNALS:
+                if sig in self._prev_handlers:
+                    signal.signal(sig, self._prev_handlers.pop(sig))
+                    continue
+                try:
+                    self._loop.remove_signal_handler(sig)
+                except NotImplementedError:
+                    pass
         await self.api_manager.shutdown()
 
-    def _handle_sigterm(self, signum, frame):
-        asyncio.get_event_loop().call_soon_threadsafe(self._shutdown_event.set)
-
-    async def _wait_for_confirmation(self) -> None:
-        while True:
-            await asyncio.sleep(1)
-
-            # if not self.feed.ready:
-            #     continue
-
-            break
-
-    async def run_forever(self):
-        while True:
-            # print("Trading loop iteration...")
-            await asyncio.sleep(600)
-
 def load_config(path: str = 'config.yml') -> Dict:
+    return _parse(path, os.stat(path).st_mtime)
+
+@functools.lru_cache(maxsize=8)
+def _parse(path: str, mtime: float) -> Dict:
     with open(path, "r") as f:
-        config = yaml.safe_load(f)
-        for key in config:
-            if isinstance(config[key], dict) and 'key' in config[key] and config[key]['key'] is not None:
-                key_name = config[key]['key']
-                config[key]['key'] = load_keys(key=key_name)
+        config = yaml.load(f, Loader=_YamlLoader)
+        for val in config.values():
+            if isinstance(val, dict) and val.get('key') is not None:
+                val['key'] = os.environ.get(val['key'])
         return config
-    
-def load_keys(path: str = '.env', key: str = None) -> Dict:
-    env_path = os.path.expanduser(path)
-    load_dotenv(dotenv_path=env_path)
-    return os.getenv(key)
 
 
 async def test(stream: Stream, te: TradingEconomics, db: Database):
@@ -102,21 +104,22 @@ async def test(stream: Stream, te: TradingEconomics, db: Database):
 
     print(news['content'])
 
-    # await stream.subscribe_all(exchange="IBKR", contract=aapl_stock, 
-    #                                duration='120 S', interval='1 min')
-    await stream.subscribe_all(exchange="IBKR", contract=nq_fut, 
-                               duration='120 S', interval='1 min')
-    await stream.subscribe_all(exchange="IBKR", contract=es_fut, 
-                                   duration='120 S', interval='1 min')
-    await stream.subscribe_all(exchange="IBKR", contract=eth_spot, 
-                                   duration='120 S', interval='1 min')
-    # await stream.subscribe_all(exchange="IBKR", contract=nvda_opt, 
-    #                                duration='120 S', interval='1 min')
-
-    await stream.subscribe_all(exchange="HyperLiquid", contract=btc_perp, 
-                                   duration='120 S', interval='1 min')
-    await stream.subscribe_all(exchange="HyperLiquid", contract=eth_perp, 
-                                   duration='120 S', interval='1 min')
+    async with asyncio.TaskGroup() as tg:
+        # tg.create_task(stream.subscribe_all(exchange="IBKR", contract=aapl_stock, 
+        #                                     duration='120 S', interval='1 min'))
+        tg.create_task(stream.subscribe_all(exchange="IBKR", contract=nq_fut, 
+                                            duration='120 S', interval='1 min'))
+        tg.create_task(stream.subscribe_all(exchange="IBKR", contract=es_fut, 
+                                            duration='120 S', interval='1 min'))
+        tg.create_task(stream.subscribe_all(exchange="IBKR", contract=eth_spot, 
+                                            duration='120 S', interval='1 min'))
+        # tg.create_task(stream.subscribe_all(exchange="IBKR", contract=nvda_opt, 
+        #                                     duration='120 S', interval='1 min'))
+
+        tg.create_task(stream.subscribe_all(exchange="HyperLiquid", contract=btc_perp, 
+                                            duration='120 S', interval='1 min'))
+        tg.create_task(stream.subscribe_all(exchange="HyperLiquid", contract=eth_perp, 
+                                            duration='120 S', interval='1 min'))
 
     # res = await hyperliquid.info.open_orders("0x6d7823cd5c3d9dcd63e6a8021b475e0c7c94b291")
     # print(res)
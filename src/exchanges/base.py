@@ -1,13 +1,27 @@
-from abc import abstractmethod, ABC
+from typing import Callable, Dict, Protocol, Type, runtime_checkable
 
-class Exchange(ABC):
-    def __init__(self):
-        super().__init__()
+_EXCHANGE_REGISTRY: Dict[str, Type] = {}
 
-    @abstractmethod
-    def connect(self) -> None:
-        pass
 
-    @abstractmethod
-    def disconnect(self) -> None:
-        pass  
\ No newline at end of file
+def register_exchange(name: str) -> Callable[[Type], Type]:
+    """Register an exchange class under ``name`` so APIManager can resolve it without introspection."""
+    def decorator(cls: Type) -> Type:
+        _EXCHANGE_REGISTRY[name.lower()] = cls
+        return cls
+    return decorator
+
+
+def get_exchange_class(name: str) -> Type:
+    return _EXCHANGE_REGISTRY.get(name.lower())
+
+
+@runtime_checkable
+class Exchange(Protocol):
+    # Set to True on exchanges whose disconnect() is a plain function rather than a coroutine
+    SYNC_DISCONNECT: bool
+
+    async def connectAsync(self, config: Dict) -> None:
+        ...
+
+    async def disconnect(self) -> None:
+        ...
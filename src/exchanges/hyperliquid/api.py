@@ -1,66 +1,103 @@
 import orjson
+import asyncio
 import aiohttp
 import logging
+import functools
 from orjson import JSONDecodeError
 
 from .constants import MAINNET_API_URL
 from .error import ClientError, ServerError
 from .types import Any
 
+_LOGGER = logging.getLogger(__name__)
+
+# warm() is best-effort, so a stalled host must not hold up startup for the session's 300 s default
+_WARM_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+
+@functools.lru_cache(maxsize=256)
+def _dumps_cached(frozen: tuple) -> bytes:
+    return orjson.dumps(dict(frozen))
+
+
+def _dumps(payload: Any) -> bytes:
+    # Flat string payloads such as {"type": "openOrders", "user": ...} repeat verbatim, so reuse their
+    # encoding. Other value types are left out since 1, 1.0 and True would share a cache key.
+    if type(payload) is dict and all(type(v) is str for v in payload.values()):
+        return _dumps_cached(tuple(payload.items()))
+    return orjson.dumps(payload)
+
+
+_shared_session: aiohttp.ClientSession = None
+
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    # Info, Exchange and any other API clients share one pool so TLS sessions and DNS lookups are reused
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60),
+            headers={"Content-Type": "application/json"}
+        )
+    return _shared_session
+
+
+async def aclose_shared() -> None:
+    """Close the aiohttp session shared by all API instances"""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+
+
 class API:
     def __init__(self, base_url=None):
         self.base_url = base_url or MAINNET_API_URL
-        self._session = None
-        self._logger = logging.getLogger(__name__)
+        self._logger = _LOGGER
 
     def _ensure_session(self):
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={"Content-Type": "application/json"},
-                json_serialize=self._json_serialize
-            )
-        return self._session
-
-    @staticmethod
-    def _json_serialize(obj):
-        # Convert orjson's bytes output to string
-        return orjson.dumps(obj).decode('utf-8')
+        return _get_shared_session()
 
     async def post(self, url_path: str, payload: Any = None) -> Any:
         payload = payload or {}
         url = self.base_url + url_path
         
         session = self._ensure_session()
-        async with session.post(url, json=payload) as response:
-            await self._handle_exception(response)
+        async with session.post(url, data=_dumps(payload)) as response:
+            if response.status >= 400:
+                await self._handle_exception(response)
+            raw = await response.read()
             try:
-                return await response.json(loads=orjson.loads)
-            except ValueError:
-                text = await response.text()
-                return {"error": f"Could not parse JSON: {text}"}
+                return orjson.loads(raw)
+            except JSONDecodeError:
+                return {"error": f"Could not parse JSON: {raw.decode('utf-8', 'replace')}"}
+
+    async def warm(self) -> None:
+        """Open a pooled keep-alive connection ahead of the first request so it doesn't pay the TLS handshake"""
+        try:
+            async with self._ensure_session().head(self.base_url, timeout=_WARM_TIMEOUT) as response:
+                await response.release()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._logger.debug(f"Connection warm-up to {self.base_url} failed: {e}")
 
     async def _handle_exception(self, response):
         status_code = response.status
-        if status_code < 400:
-            return
-            
-        text = await response.text()
+        raw = await response.read()
+        text = raw.decode('utf-8', 'replace')
         
         if 400 <= status_code < 500:
             try:
-                err = orjson.loads(text)
+                err = orjson.loads(raw)
             except JSONDecodeError:
                 raise ClientError(status_code, None, text, None, response.headers)
                 
-            if err is None:
+            if not isinstance(err, dict):
                 raise ClientError(status_code, None, text, None, response.headers)
                 
-            error_data = err.get("data")
-            raise ClientError(status_code, err["code"], err["msg"], response.headers, error_data)
+            raise ClientError(status_code, err.get("code"), err.get("msg"), response.headers, err.get("data"))
             
         raise ServerError(status_code, text)
         
     async def close(self):
-        """Close the aiohttp session"""
-        if self._session and not self._session.closed:
-            await self._session.close()
\ No newline at end of file
+        """The session is shared between instances and closed with aclose_shared()"""
+        pass
\ No newline at end of file
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+
+from .exchange import Exchange
+from .signing import OrderRequest
+from .types import Any, Dict, List, NamedTuple, Optional
+
+PendingOrder = NamedTuple("PendingOrder", [("request", OrderRequest), ("future", asyncio.Future)])
+
+
+class OrderBatcher:
+    """Coalesces orders submitted within ``interval`` seconds into one signed ``bulk_orders`` action.
+
+    ALO orders are queued separately from GTC/IOC so post-only flow is never held behind the
+    taker speed bump applied to batches containing aggressive orders.
+    """
+
+    def __init__(self, exchange: Exchange, interval: float = 0.05, max_batch_size: int = 50):
+        self._logger = logging.getLogger("hl_async.batcher")
+        self.exchange = exchange
+        self.interval = interval
+        self.max_batch_size = max_batch_size
+        self._queues: Dict[bool, asyncio.Queue] = {True: asyncio.Queue(), False: asyncio.Queue()}
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush anything still queued and stop the background task"""
+        # The task is left to finish its current flush rather than cancelled, since a cancelled
+        # _send would leave its batch's futures unresolved with the orders possibly already sent
+        self._stopping = True
+        if self._task:
+            await self._task
+            self._task = None
+        await self._flush()
+
+    async def submit(self, order_request: OrderRequest) -> Any:
+        """Queue an order and wait for its entry in the batched response"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        is_alo = order_request["order_type"].get("limit", {}).get("tif") == "Alo"
+        self._queues[is_alo].put_nowait(PendingOrder(order_request, future))
+        return await future
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(self.interval)
+            await self._flush()
+
+    async def _flush(self) -> None:
+        for queue in self._queues.values():
+            while not queue.empty():
+                batch: List[PendingOrder] = []
+                while len(batch) < self.max_batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+                await self._send(batch)
+
+    async def _send(self, batch: List[PendingOrder]) -> None:
+        try:
+            response = await self.exchange.bulk_orders([pending.request for pending in batch])
+        except Exception as e:
+            self._logger.error(f"Batched order submission failed: {e}")
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+        except BaseException:
+            # Cancelled mid-request: the batch is already off the queue, so release its callers
+            for pending in batch:
+                pending.future.cancel()
+            raise
+
+        statuses = None
+        if isinstance(response, dict) and response.get("status") == "ok":
+            statuses = response["response"]["data"]["statuses"]
+
+        for i, pending in enumerate(batch):
+            if pending.future.done():
+                continue
+            if statuses is not None and i < len(statuses):
+                pending.future.set_result(statuses[i])
+            else:
+                pending.future.set_result(response)
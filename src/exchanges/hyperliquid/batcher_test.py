@@ -0,0 +1,134 @@
+import asyncio
+import logging
+
+from src.exchanges.hyperliquid.batcher import OrderBatcher
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class FakeExchange:
+    """Records each bulk_orders call and answers with one status per order"""
+
+    def __init__(self, delay=0.0, error=None):
+        self.calls = []
+        self.delay = delay
+        self.error = error
+
+    async def bulk_orders(self, order_requests):
+        self.calls.append(order_requests)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        statuses = [{"resting": {"oid": order["sz"]}} for order in order_requests]
+        return {"status": "ok", "response": {"type": "order", "data": {"statuses": statuses}}}
+
+
+def make_order(sz, tif="Gtc"):
+    return {
+        "coin": "BTC",
+        "is_buy": True,
+        "sz": sz,
+        "limit_px": 100.0,
+        "order_type": {"limit": {"tif": tif}},
+        "reduce_only": False,
+    }
+
+
+def test_fan_out():
+    """Each submitter gets the status at its own position in the batched response"""
+    async def run():
+        exchange = FakeExchange()
+        batcher = OrderBatcher(exchange, interval=0.01)
+        results = await asyncio.gather(*(batcher.submit(make_order(i)) for i in range(5)))
+        await batcher.stop()
+        return exchange, results
+
+    exchange, results = asyncio.run(run())
+    assert len(exchange.calls) == 1, f"Expected one bulk_orders call, got {len(exchange.calls)}"
+    assert results == [{"resting": {"oid": i}} for i in range(5)], f"Statuses were not fanned out in order: {results}"
+    logger.info("Fan-out test passed")
+
+
+def test_max_batch_size():
+    """A backlog larger than max_batch_size is split across several calls"""
+    async def run():
+        exchange = FakeExchange()
+        batcher = OrderBatcher(exchange, interval=0.01, max_batch_size=2)
+        results = await asyncio.gather(*(batcher.submit(make_order(i)) for i in range(5)))
+        await batcher.stop()
+        return exchange, results
+
+    exchange, results = asyncio.run(run())
+    sizes = [len(call) for call in exchange.calls]
+    assert sizes == [2, 2, 1], f"Expected batches of [2, 2, 1], got {sizes}"
+    assert results == [{"resting": {"oid": i}} for i in range(5)], f"Statuses were not matched to orders: {results}"
+    logger.info("Batch size test passed")
+
+
+def test_alo_separation():
+    """ALO orders never share a batch with GTC/IOC orders"""
+    async def run():
+        exchange = FakeExchange()
+        batcher = OrderBatcher(exchange, interval=0.01)
+        orders = [make_order(0, "Alo"), make_order(1, "Gtc"), make_order(2, "Alo"), make_order(3, "Ioc")]
+        await asyncio.gather(*(batcher.submit(order) for order in orders))
+        await batcher.stop()
+        return exchange
+
+    exchange = asyncio.run(run())
+    assert len(exchange.calls) == 2, f"Expected one ALO and one non-ALO batch, got {len(exchange.calls)}"
+    for call in exchange.calls:
+        tifs = {order["order_type"]["limit"]["tif"] for order in call}
+        assert tifs == {"Alo"} or "Alo" not in tifs, f"Batch mixes ALO with other orders: {tifs}"
+    logger.info("ALO separation test passed")
+
+
+def test_error_propagation():
+    """A failed submission raises in every caller of that batch"""
+    async def run():
+        batcher = OrderBatcher(FakeExchange(error=RuntimeError("rejected")), interval=0.01)
+        results = await asyncio.gather(*(batcher.submit(make_order(i)) for i in range(3)), return_exceptions=True)
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results), f"Expected RuntimeError for every order, got {results}"
+    logger.info("Error propagation test passed")
+
+
+def test_stop():
+    """stop() lets an in-flight batch resolve and flushes whatever is still queued"""
+    async def run():
+        exchange = FakeExchange(delay=0.05)
+        batcher = OrderBatcher(exchange, interval=0.01)
+        in_flight = [asyncio.create_task(batcher.submit(make_order(i))) for i in range(2)]
+        # Let the first batch reach bulk_orders before stopping
+        await asyncio.sleep(0.02)
+        queued = asyncio.create_task(batcher.submit(make_order(2)))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(batcher.stop(), timeout=1)
+        results = await asyncio.wait_for(asyncio.gather(*in_flight, queued), timeout=1)
+        return exchange, batcher, results
+
+    exchange, batcher, results = asyncio.run(run())
+    assert results == [{"resting": {"oid": i}} for i in range(3)], f"Orders were lost across stop(): {results}"
+    assert [len(call) for call in exchange.calls] == [2, 1], f"Unexpected batches: {exchange.calls}"
+    assert batcher._task is None, "Background task should be cleared after stop()"
+    logger.info("Stop test passed")
+
+
+def test_all():
+    """Run all tests"""
+    test_fan_out()
+    test_max_batch_size()
+    test_alo_separation()
+    test_error_propagation()
+    test_stop()
+    logger.info("All tests completed")
+
+
+if __name__ == "__main__":
+    test_all()
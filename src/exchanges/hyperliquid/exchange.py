@@ -1,3 +1,6 @@
+import json
+import time
+import asyncio
 import secrets
 import logging
 
@@ -23,14 +26,17 @@ from .signing import (
     sign_agent,
     sign_approve_builder_fee,
     sign_convert_to_multi_sig_user_action,
-    sign_l1_action,
+    sign_l1_action_fast,
     sign_multi_sig_action,
     sign_spot_transfer_action,
     sign_usd_class_transfer_action,
     sign_usd_transfer_action,
     sign_withdraw_from_bridge_action,
 )
-from .types import Any, BuilderInfo, Cloid, List, Meta, Optional, SpotMeta, Tuple
+from .types import Any, BuilderInfo, Cloid, Dict, List, Meta, Optional, SpotMeta, Tuple
+
+# market_open/market_close calls within this many seconds share one all_mids() request
+_MIDS_MEMO_SECONDS = 0.25
 
 
 class Exchange(API):
@@ -45,20 +51,55 @@ class Exchange(API):
         vault_address: Optional[str] = None,
         account_address: Optional[str] = None,
         spot_meta: Optional[SpotMeta] = None,
+        info: Optional[Info] = None,
     ):
         super().__init__(base_url)
         self.wallet = wallet
+        self._wallet_addr_lc = wallet.address.lower()
         self.vault_address = vault_address
         self.account_address = account_address
-        self.info = Info(base_url, True, meta, spot_meta)
+        # Reuse a caller's Info so its metadata and websocket are not fetched and opened a second time
+        self._owns_info = info is None
+        self.info = Info(base_url, True, meta, spot_meta) if info is None else info
+        self._is_mainnet = self.base_url == MAINNET_API_URL
+        self._asset_cache: Dict[str, Tuple[int, str, int, bool, int]] = {}
+        self._mids_fetch: Optional[asyncio.Future] = None
+        self._mids_fetched_at = 0.0
         self._initialized = False
         
     async def initialize(self):
         """Initialize the Exchange instance with metadata"""
         if not self._initialized:
-            await self.info.initialize()
+            await asyncio.gather(self.info.initialize(), self.warm())
+            self._build_asset_cache()
             self._initialized = True
 
+    def _build_asset_cache(self):
+        """Flatten name -> (asset, coin, sz_decimals, is_spot, px_decimals); rebuild whenever info metadata changes"""
+        info = self.info
+        cache = {}
+        for name, coin in info.name_to_coin.items():
+            asset = info.coin_to_asset[coin]
+            # spot assets start at 10000
+            is_spot = asset >= 10_000
+            cache[name] = (asset, coin, info.asset_to_sz_decimals[asset], is_spot, 8 if is_spot else 6)
+        self._asset_cache = cache
+
+    async def _mid_price(self, coin: str) -> float:
+        now = time.monotonic()
+        if self._mids_fetch is None or now - self._mids_fetched_at > _MIDS_MEMO_SECONDS:
+            self._mids_fetch = asyncio.ensure_future(self.info.all_mids())
+            self._mids_fetched_at = now
+        fetch = self._mids_fetch
+        try:
+            # Shielded so one cancelled caller doesn't cancel the request the others are waiting on
+            mids = await asyncio.shield(fetch)
+        except Exception:
+            if self._mids_fetch is fetch:
+                self._mids_fetch = None
+            raise
+        return float(mids[coin])
+
     async def _post_action(self, action, signature, nonce):
         payload = {
             "action": action,
@@ -77,20 +118,17 @@ class Exchange(API):
         px: Optional[float] = None,
     ) -> float:
         """Calculate price with slippage (doesn't need to be async)"""
-        coin = self.info.name_to_coin[name]
         if not px:
             # Since all_mids is async, we need to handle this case differently now
             # This will be addressed by the caller
             raise ValueError("Must provide px when using _slippage_price directly")
 
-        asset = self.info.coin_to_asset[coin]
-        # spot assets start at 10000
-        is_spot = asset >= 10_000
+        _, _, sz_decimals, _, px_decimals = self._asset_cache[name]
 
         # Calculate Slippage
         px *= (1 + slippage) if is_buy else (1 - slippage)
         # We round px to 5 significant figures and 6 decimals for perps, 8 decimals for spot
-        return round(float(f"{px:.5g}"), (6 if not is_spot else 8) - self.info.asset_to_sz_decimals[asset])
+        return round(float(f"{px:.5g}"), px_decimals - sz_decimals)
 
     async def order(
         self,
@@ -103,7 +141,8 @@ class Exchange(API):
         cloid: Optional[Cloid] = None,
         builder: Optional[BuilderInfo] = None,
     ) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         order: OrderRequest = {
             "coin": name,
             "is_buy": is_buy,
@@ -117,22 +156,23 @@ class Exchange(API):
         return await self.bulk_orders([order], builder)
 
     async def bulk_orders(self, order_requests: List[OrderRequest], builder: Optional[BuilderInfo] = None) -> Any:
-        await self.initialize()
-        order_wires: List[OrderWire] = [
-            order_request_to_order_wire(order, self.info.name_to_asset(order["coin"])) for order in order_requests
-        ]
+        if not self._initialized:
+            await self.initialize()
+        n2a = self.info.name_to_asset
+        to_wire = order_request_to_order_wire
+        order_wires: List[OrderWire] = [to_wire(order, n2a(order["coin"])) for order in order_requests]
         timestamp = get_timestamp_ms()
 
         if builder:
             builder["b"] = builder["b"].lower()
         order_action = order_wires_to_order_action(order_wires, builder)
 
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             order_action,
             self.vault_address,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
 
         return await self._post_action(
@@ -152,7 +192,8 @@ class Exchange(API):
         reduce_only: bool = False,
         cloid: Optional[Cloid] = None,
     ) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         modify: ModifyRequest = {
             "oid": oid,
             "order": {
@@ -168,12 +209,15 @@ class Exchange(API):
         return await self.bulk_modify_orders_new([modify])
 
     async def bulk_modify_orders_new(self, modify_requests: List[ModifyRequest]) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
+        n2a = self.info.name_to_asset
+        to_wire = order_request_to_order_wire
         modify_wires = [
             {
                 "oid": modify["oid"].to_raw() if isinstance(modify["oid"], Cloid) else modify["oid"],
-                "order": order_request_to_order_wire(modify["order"], self.info.name_to_asset(modify["order"]["coin"])),
+                "order": to_wire(modify["order"], n2a(modify["order"]["coin"])),
             }
             for modify in modify_requests
         ]
@@ -183,12 +227,12 @@ class Exchange(API):
             "modifies": modify_wires,
         }
 
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             modify_action,
             self.vault_address,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
 
         return await self._post_action(
@@ -207,12 +251,11 @@ class Exchange(API):
         cloid: Optional[Cloid] = None,
         builder: Optional[BuilderInfo] = None,
     ) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         # Get aggressive Market Price
         if px is None:
-            mids = await self.info.all_mids()
-            coin = self.info.name_to_coin[name]
-            px = float(mids[coin])
+            px = await self._mid_price(self.info.name_to_coin[name])
             
         px = self._slippage_price(name, is_buy, slippage, px)
         # Market Order is an aggressive Limit Order IoC
@@ -229,7 +272,8 @@ class Exchange(API):
         cloid: Optional[Cloid] = None,
         builder: Optional[BuilderInfo] = None,
     ) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         address: str = self.wallet.address
         if self.account_address:
             address = self.account_address
@@ -252,9 +296,7 @@ class Exchange(API):
             
             # Get aggressive Market Price
             if px is None:
-                mids = await self.info.all_mids()
-                coin_key = self.info.name_to_coin[coin]
-                px = float(mids[coin_key])
+                px = await self._mid_price(self.info.name_to_coin[coin])
                 
             px = self._slippage_price(coin, is_buy, slippage, px)
             
@@ -271,32 +313,36 @@ class Exchange(API):
             )
 
     async def cancel(self, name: str, oid: int) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         return await self.bulk_cancel([{"coin": name, "oid": oid}])
 
     async def cancel_by_cloid(self, name: str, cloid: Cloid) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         return await self.bulk_cancel_by_cloid([{"coin": name, "cloid": cloid}])
 
     async def bulk_cancel(self, cancel_requests: List[CancelRequest]) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
+        n2a = self.info.name_to_asset
         cancel_action = {
             "type": "cancel",
             "cancels": [
                 {
-                    "a": self.info.name_to_asset(cancel["coin"]),
+                    "a": n2a(cancel["coin"]),
                     "o": cancel["oid"],
                 }
                 for cancel in cancel_requests
             ],
         }
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             cancel_action,
             self.vault_address,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
 
         return await self._post_action(
@@ -306,25 +352,27 @@ class Exchange(API):
         )
 
     async def bulk_cancel_by_cloid(self, cancel_requests: List[CancelByCloidRequest]) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
+        n2a = self.info.name_to_asset
 
         cancel_action = {
             "type": "cancelByCloid",
             "cancels": [
                 {
-                    "asset": self.info.name_to_asset(cancel["coin"]),
+                    "asset": n2a(cancel["coin"]),
                     "cloid": cancel["cloid"].to_raw(),
                 }
                 for cancel in cancel_requests
             ],
         }
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             cancel_action,
             self.vault_address,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
 
         return await self._post_action(
@@ -341,19 +389,20 @@ class Exchange(API):
         Args:
             time (int): if time is not None, then set the cancel time in the future. If None, then unsets any cancel time in the future.
         """
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         schedule_cancel_action: ScheduleCancelAction = {
             "type": "scheduleCancel",
         }
         if time is not None:
             schedule_cancel_action["time"] = time
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             schedule_cancel_action,
             self.vault_address,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
         return await self._post_action(
             schedule_cancel_action,
@@ -362,7 +411,8 @@ class Exchange(API):
         )
 
     async def update_leverage(self, leverage: int, name: str, is_cross: bool = True) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         update_leverage_action = {
             "type": "updateLeverage",
@@ -370,12 +420,12 @@ class Exchange(API):
             "isCross": is_cross,
             "leverage": leverage,
         }
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             update_leverage_action,
             self.vault_address,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
         return await self._post_action(
             update_leverage_action,
@@ -384,7 +434,8 @@ class Exchange(API):
         )
 
     async def update_isolated_margin(self, amount: float, name: str) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         amount = float_to_usd_int(amount)
         update_isolated_margin_action = {
@@ -393,12 +444,12 @@ class Exchange(API):
             "isBuy": True,
             "ntli": amount,
         }
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             update_isolated_margin_action,
             self.vault_address,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
         return await self._post_action(
             update_isolated_margin_action,
@@ -407,18 +458,19 @@ class Exchange(API):
         )
         
     async def set_referrer(self, code: str) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         set_referrer_action = {
             "type": "setReferrer",
             "code": code,
         }
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             set_referrer_action,
             None,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
         return await self._post_action(
             set_referrer_action,
@@ -427,18 +479,19 @@ class Exchange(API):
         )
 
     async def create_sub_account(self, name: str) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         create_sub_account_action = {
             "type": "createSubAccount",
             "name": name,
         }
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             create_sub_account_action,
             None,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
         return await self._post_action(
             create_sub_account_action,
@@ -447,7 +500,8 @@ class Exchange(API):
         )
 
     async def usd_class_transfer(self, amount: float, to_perp: bool) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         str_amount = str(amount)
         if self.vault_address:
@@ -459,7 +513,7 @@ class Exchange(API):
             "toPerp": to_perp,
             "nonce": timestamp,
         }
-        signature = sign_usd_class_transfer_action(self.wallet, action, self.base_url == MAINNET_API_URL)
+        signature = sign_usd_class_transfer_action(self.wallet, action, self._is_mainnet)
         return await self._post_action(
             action,
             signature,
@@ -467,7 +521,8 @@ class Exchange(API):
         )
 
     async def sub_account_transfer(self, sub_account_user: str, is_deposit: bool, usd: int) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         sub_account_transfer_action = {
             "type": "subAccountTransfer",
@@ -475,12 +530,12 @@ class Exchange(API):
             "isDeposit": is_deposit,
             "usd": usd,
         }
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             sub_account_transfer_action,
             None,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
         return await self._post_action(
             sub_account_transfer_action,
@@ -489,7 +544,8 @@ class Exchange(API):
         )
         
     async def sub_account_spot_transfer(self, sub_account_user: str, is_deposit: bool, token: str, amount: float) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         sub_account_transfer_action = {
             "type": "subAccountSpotTransfer",
@@ -498,12 +554,12 @@ class Exchange(API):
             "token": token,
             "amount": str(amount),
         }
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             sub_account_transfer_action,
             None,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
         return await self._post_action(
             sub_account_transfer_action,
@@ -512,7 +568,8 @@ class Exchange(API):
         )
 
     async def vault_usd_transfer(self, vault_address: str, is_deposit: bool, usd: int) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         vault_transfer_action = {
             "type": "vaultTransfer",
@@ -520,8 +577,8 @@ class Exchange(API):
             "isDeposit": is_deposit,
             "usd": usd,
         }
-        is_mainnet = self.base_url == MAINNET_API_URL
-        signature = sign_l1_action(self.wallet, vault_transfer_action, None, timestamp, is_mainnet)
+        is_mainnet = self._is_mainnet
+        signature = sign_l1_action_fast(self.wallet, vault_transfer_action, None, timestamp, is_mainnet)
         return await self._post_action(
             vault_transfer_action,
             signature,
@@ -529,10 +586,11 @@ class Exchange(API):
         )
 
     async def usd_transfer(self, amount: float, destination: str) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         action = {"destination": destination, "amount": str(amount), "time": timestamp, "type": "usdSend"}
-        is_mainnet = self.base_url == MAINNET_API_URL
+        is_mainnet = self._is_mainnet
         signature = sign_usd_transfer_action(self.wallet, action, is_mainnet)
         return await self._post_action(
             action,
@@ -541,7 +599,8 @@ class Exchange(API):
         )
 
     async def spot_transfer(self, amount: float, destination: str, token: str) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         action = {
             "destination": destination,
@@ -550,7 +609,7 @@ class Exchange(API):
             "time": timestamp,
             "type": "spotSend",
         }
-        is_mainnet = self.base_url == MAINNET_API_URL
+        is_mainnet = self._is_mainnet
         signature = sign_spot_transfer_action(self.wallet, action, is_mainnet)
         return await self._post_action(
             action,
@@ -559,10 +618,11 @@ class Exchange(API):
         )
         
     async def withdraw_from_bridge(self, amount: float, destination: str) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         action = {"destination": destination, "amount": str(amount), "time": timestamp, "type": "withdraw3"}
-        is_mainnet = self.base_url == MAINNET_API_URL
+        is_mainnet = self._is_mainnet
         signature = sign_withdraw_from_bridge_action(self.wallet, action, is_mainnet)
         return await self._post_action(
             action,
@@ -571,11 +631,13 @@ class Exchange(API):
         )
 
     async def approve_agent(self, name: Optional[str] = None) -> Tuple[Any, str]:
-        await self.initialize()
-        agent_key = "0x" + secrets.token_hex(32)
-        account = eth_account.Account.from_key(agent_key)
+        if not self._initialized:
+            await self.initialize()
+        key_bytes = secrets.token_bytes(32)
+        account = eth_account.Account.from_key(key_bytes)
+        agent_key = "0x" + key_bytes.hex()
         timestamp = get_timestamp_ms()
-        is_mainnet = self.base_url == MAINNET_API_URL
+        is_mainnet = self._is_mainnet
         action = {
             "type": "approveAgent",
             "agentAddress": account.address,
@@ -596,16 +658,17 @@ class Exchange(API):
         )
 
     async def approve_builder_fee(self, builder: str, max_fee_rate: str) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
 
         action = {"maxFeeRate": max_fee_rate, "builder": builder, "nonce": timestamp, "type": "approveBuilderFee"}
-        signature = sign_approve_builder_fee(self.wallet, action, self.base_url == MAINNET_API_URL)
+        signature = sign_approve_builder_fee(self.wallet, action, self._is_mainnet)
         return await self._post_action(action, signature, timestamp)
         
     async def convert_to_multi_sig_user(self, authorized_users: List[str], threshold: int) -> Any:
-        await self.initialize()
-        import json
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         authorized_users = sorted(authorized_users)
         signers = {
@@ -614,10 +677,11 @@ class Exchange(API):
         }
         action = {
             "type": "convertToMultiSigUser",
+            # Keep json's default ", "/": " separators: this string is signed and must match the reference SDK byte-for-byte
             "signers": json.dumps(signers),
             "nonce": timestamp,
         }
-        signature = sign_convert_to_multi_sig_user_action(self.wallet, action, self.base_url == MAINNET_API_URL)
+        signature = sign_convert_to_multi_sig_user_action(self.wallet, action, self._is_mainnet)
         return await self._post_action(
             action,
             signature,
@@ -625,7 +689,8 @@ class Exchange(API):
         )
 
     async def multi_sig(self, multi_sig_user, inner_action, signatures, nonce, vault_address=None):
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         multi_sig_user = multi_sig_user.lower()
         multi_sig_action = {
             "type": "multiSig",
@@ -633,11 +698,11 @@ class Exchange(API):
             "signatures": signatures,
             "payload": {
                 "multiSigUser": multi_sig_user,
-                "outerSigner": self.wallet.address.lower(),
+                "outerSigner": self._wallet_addr_lc,
                 "action": inner_action,
             },
         }
-        is_mainnet = self.base_url == MAINNET_API_URL
+        is_mainnet = self._is_mainnet
         signature = sign_multi_sig_action(
             self.wallet,
             multi_sig_action,
@@ -652,18 +717,19 @@ class Exchange(API):
         )
 
     async def use_big_blocks(self, enable: bool) -> Any:
-        await self.initialize()
+        if not self._initialized:
+            await self.initialize()
         timestamp = get_timestamp_ms()
         action = {
             "type": "evmUserModify",
             "usingBigBlocks": enable,
         }
-        signature = sign_l1_action(
+        signature = sign_l1_action_fast(
             self.wallet,
             action,
             None,
             timestamp,
-            self.base_url == MAINNET_API_URL,
+            self._is_mainnet,
         )
         return await self._post_action(
             action,
@@ -674,5 +740,6 @@ class Exchange(API):
     async def shutdown(self) -> None:
         if self._initialized:
             # await self.info.ws_manager.stop()
-            await self.info.close()
+            if self._owns_info:
+                await self.info.close()
             await self.close()
\ No newline at end of file
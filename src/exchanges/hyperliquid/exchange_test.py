@@ -0,0 +1,35 @@
+import logging
+
+import eth_account
+
+from src.exchanges.hyperliquid.constants import MAINNET_API_URL, TESTNET_API_URL
+from src.exchanges.hyperliquid.exchange import Exchange
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def test_construct_exchange():
+    """Exchange can be built without a running loop and knows which network it signs for"""
+    wallet = eth_account.Account.create()
+
+    exchange = Exchange(wallet, MAINNET_API_URL)
+    assert exchange._is_mainnet, "Mainnet URL should sign for mainnet"
+
+    exchange = Exchange(wallet)
+    assert exchange._is_mainnet, "Default base_url is mainnet"
+
+    exchange = Exchange(wallet, TESTNET_API_URL)
+    assert not exchange._is_mainnet, "Testnet URL should not sign for mainnet"
+    logger.info("Exchange construction test passed")
+
+
+def test_all():
+    """Run all tests"""
+    test_construct_exchange()
+    logger.info("All tests completed")
+
+
+if __name__ == "__main__":
+    test_all()
@@ -1,17 +1,74 @@
+import re
+import sys
 import time
+import asyncio
 import logging
+import functools
+from types import MappingProxyType
+from collections import deque
 
 import eth_account
 from eth_account.signers.local import LocalAccount
 
-from typing import Dict, List, Callable
+from typing import Deque, Dict, List, Callable, Mapping, Optional, Tuple
 
+from src.exchanges.base import register_exchange
+from .api import aclose_shared
 from .exchange import Exchange
 from .info import Info
 from .constants import MAINNET_API_URL
 
+_TRADE_BATCH_SIZE = 128
 
+# Static contract fields; symbol and multiplier are filled in per symbol
+_CONTRACT_TEMPLATE = {
+    "symbol": None,
+    "secType": "PERP",
+    "exchange": "HYPERLIQUID",
+    "multiplier": None,
+    "currency": "USD",
+}
+
+# Map common IBKR intervals to hyperliquid intervals
+_INTERVAL_MAP = MappingProxyType({
+    '1 min': '1m',
+    '5 mins': '5m',
+    '15 mins': '15m',
+    '1 hour': '1h',
+    '4 hours': '4h',
+    '1 day': '1d',
+})
+_INTERVAL_RE = re.compile(r'^(\d+)\s*(min|mins|hour|hours|day|days)$')
+
+
+def _format_levels(levels: List[Dict]) -> List[Dict]:
+    # The database layer indexes levels by key, so records stay dicts rather than columnar arrays
+    return [{"price": float(level['px']), "qty": float(level['sz']), "orders": level['n']} for level in levels]
+
+
+def _top_px(levels: List[Dict]) -> Optional[str]:
+    return levels[0]['px'] if levels else None
+
+
+class _Forwarder:
+    """Websocket callback that formats a message and passes it on; replaces a closure per subscription"""
+    __slots__ = ("callback", "formatter", "args")
+
+    def __init__(self, callback: Callable, formatter: Callable, *args):
+        self.callback = callback
+        self.formatter = formatter
+        self.args = args
+
+    async def __call__(self, message: Dict):
+        data = self.formatter(message, *self.args)
+        if data is not None:
+            await self.callback(data)
+
+
+@register_exchange("hl")
 class HL:
+    SYNC_DISCONNECT = False
+
     def __init__(self):
         self._logger = logging.getLogger("hl_async.hl")
 
@@ -19,7 +76,9 @@ class HL:
         self.exchange: Exchange = None
         self.address: str = None
 
-        self._candle_cache = {}
+        self._candle_cache: Dict[Tuple[str, str], Tuple[Dict, ...]] = {}
+        self._contract_cache: Dict[str, Mapping] = {}
+        self._delivery_tasks: List[asyncio.Task] = []
 
         # self.topics = {
         #     "trades": self.msg_callback,
@@ -45,18 +104,20 @@ class HL:
 
         if vault:
             agent_exchange = Exchange(wallet=agent_account, base_url=MAINNET_API_URL, 
-                                      vault_address=vault)
+                                      vault_address=vault, info=info)
             self.address = vault
         else:
             agent_exchange = Exchange(wallet=agent_account, base_url=MAINNET_API_URL, 
-                                      account_address=address)
+                                      account_address=address, info=info)
             self.address = address
         
         self.info = info
         self.exchange = agent_exchange
 
-        await self.info.initialize()
+        # Exchange.initialize overlaps Info.initialize with the connection warm-up
         await self.exchange.initialize()
+        # Max leverage comes from the freshly loaded meta, so drop contracts cached by a previous session
+        self._contract_cache.clear()
 
         await exchange.shutdown()
         self._logger.info("Connected to HyperLiquid")
@@ -69,19 +130,22 @@ class HL:
         if address != account.address:
             self._logger.info(f"Running with agent address: {account.address}")
         info = Info(base_url, skip_ws)
-        user_state = await info.user_state(address)
-        spot_user_state = await info.spot_user_state(address)
+        user_state, spot_user_state = await asyncio.gather(info.user_state(address), info.spot_user_state(address))
         margin_summary = user_state["marginSummary"]
         if float(margin_summary["accountValue"]) == 0 and len(spot_user_state["balances"]) == 0:
             self._logger.error("Not running the example because the provided account has no equity.")
             url = info.base_url.split(".", 1)[1]
             error_string = f"No accountValue:\nIf you think this is a mistake, make sure that {address} has a balance on {url}.\nIf address shown is your API wallet address, update the config to specify the address of your account, not the address of the API wallet."
             raise Exception(error_string)
-        exchange = Exchange(wallet=account, base_url=base_url, account_address=address)
+        exchange = Exchange(wallet=account, base_url=base_url, account_address=address, info=info)
         return address, info, exchange
 
     async def disconnect(self) -> None:
         self._logger.info("Disconnecting...")
+        for task in self._delivery_tasks:
+            task.cancel()
+        self._delivery_tasks.clear()
+
         if self.exchange:
             try:
                 await self.exchange.close()
@@ -92,61 +156,82 @@ class HL:
         if self.info:
             try:
                 await self.info.close()
-                await self.info.ws_manager.stop()
+                await self.info.disconnect_websocket()
                 self._logger.debug("Info session closed")
             except Exception as e:
                 self._logger.error(f"Error closing Info API session: {e}")
 
+        try:
+            await aclose_shared()
+        except Exception as e:
+            self._logger.error(f"Error closing shared HTTP session: {e}")
+
         self._logger.info("Disconnected from HyperLiquid")
 
+    def _contract_info(self, symbol: str) -> Mapping:
+        """Read-only contract description for a symbol, built once and shared by every message"""
+        contract_info = self._contract_cache.get(symbol)
+        if contract_info is None:
+            fields = _CONTRACT_TEMPLATE.copy()
+            fields["symbol"] = sys.intern(symbol)
+            fields["multiplier"] = self.info.get_max_leverage(name=symbol)
+            contract_info = MappingProxyType(fields)
+            self._contract_cache[symbol] = contract_info
+        return contract_info
+
     async def subscribe_trades(self, contract: Dict, callback: Callable):
         self._logger.debug(f"Subscribing to trades for {contract['symbol']}")
         subscription = {f"type": "trades", "coin": contract['symbol']}
 
-        # TEMPORARY
+        contract_info = self._contract_info(self.info.name_to_coin.get(contract['symbol'], contract['symbol']))
+
+        pending: Deque[Dict] = deque()
+        wakeup = asyncio.Event()
+
+        # The websocket reader awaits this inline, so only queue here and let _drain_trades do the slow delivery
         async def forward_data(message):
-            data = self._format_trade_data(message)
-            await callback(data)
+            pending.extend(self._format_trade_data(message, contract_info))
+            wakeup.set()
         try:
             await self.info.subscribe(subscription=subscription, callback=forward_data)
+            self._delivery_tasks.append(asyncio.create_task(self._drain_trades(pending, wakeup, callback)))
             self._logger.debug(f"Subscribed to trades for {contract['symbol']}")
         except Exception as e:
             self._logger.error(f"Failed to subscribe to trades for {contract['symbol']}: {e}")
-    
-    def _format_trade_data(self, message: List[Dict]) -> List[Dict]:
-        formatted_trades = []
-        
-        for trade in message['data']:
-            contract_info = {
-                "symbol": trade['coin'],
-                "secType": "PERP",
-                "exchange": "HYPERLIQUID",
-                "multiplier": self.info.get_max_leverage(name=trade['coin']),
-                "currency": "USD",
-            }
 
-            formatted_trade = {
+    async def _drain_trades(self, pending: Deque[Dict], wakeup: asyncio.Event, callback: Callable):
+        """Deliver trades that piled up while the previous callback ran as one list, up to _TRADE_BATCH_SIZE"""
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            while pending:
+                batch = [pending.popleft() for _ in range(min(len(pending), _TRADE_BATCH_SIZE))]
+                try:
+                    await callback(batch)
+                except Exception as e:
+                    self._logger.error(f"Error delivering {len(batch)} trades: {e}")
+    
+    def _format_trade_data(self, message: List[Dict], contract_info: Mapping) -> List[Dict]:
+        return [
+            {
                 "contract": contract_info,
                 "timestamp": trade.get('time', 0),
-                "price": float(trade.get('px', 0)),
-                "qty": float(trade.get('sz', 0)),
+                "price": float(trade['px']),
+                "qty": float(trade['sz']),
                 "side": trade.get('side', ''),  # 'B' for buy, 'A' for ask/sell
                 "hash": trade.get('hash', ''),
                 "tid": trade.get('tid', 0),
                 "users": trade.get('users', [])
             }
-            
-            formatted_trades.append(formatted_trade)
-        
-        return formatted_trades
+            for trade in message['data']
+        ]
 
     async def subscribe_orderbook(self, contract: Dict, callback: Callable):
         self._logger.debug(f"Subscribing to orderbook for {contract['symbol']}")
         subscription = {"type": "l2Book", "coin": contract['symbol']}
 
-        async def forward_data(message):
-            data = self._format_orderbook_data(message)
-            await callback(data)
+        # The websocket hands one frame to every l2Book subscriber of a coin, so each keeps its own last signature
+        forward_data = _Forwarder(callback, self._format_orderbook_data, [None])
         
         try:
             await self.info.subscribe(subscription=subscription, callback=forward_data)
@@ -154,48 +239,36 @@ class HL:
         except Exception as e:
             self._logger.error(f"Failed to subscribe to orderbook for {contract['symbol']}: {e}")
 
-    def _format_orderbook_data(self, message: Dict) -> Dict:
+    def _format_orderbook_data(self, message: Dict, last_sig: List) -> Optional[Dict]:
         data = message.get('data', {})
+        coin = data['coin']
+        levels = data.get('levels')
 
-        contract_info = {
-            "symbol": data['coin'],
-            "secType": "PERP",
-            "exchange": "HYPERLIQUID",
-            "multiplier": self.info.get_max_leverage(name=data['coin']),
-            "currency": "USD",
-        }
+        # Resent snapshots carry the same time and top of book; returning None tells the forwarder to skip them
+        if levels and len(levels) == 2:
+            signature = (data['time'], _top_px(levels[0]), _top_px(levels[1]))
+        else:
+            signature = (data['time'], None, None)
+        if last_sig[0] == signature:
+            return None
+        last_sig[0] = signature
 
-        formatted_data = {
+        contract_info = self._contract_info(coin)
+
+        if levels and len(levels) == 2:
+            # Bids are at index 0, asks at index 1
+            bids = _format_levels(levels[0])
+            asks = _format_levels(levels[1])
+        else:
+            bids = []
+            asks = []
+
+        return {
             "contract": contract_info,
             "timestamp": data['time'],
-            "bids": [],
-            "asks": []
+            "bids": bids,
+            "asks": asks
         }
-        
-        if 'levels' in data and len(data['levels']) == 2:
-            # Bids are at index 0, asks at index 1
-            bids = data['levels'][0]
-            asks = data['levels'][1]
-            
-            formatted_data["bids"] = [
-                {
-                    "price": float(level['px']),
-                    "qty": float(level['sz']),
-                    "orders": level['n']
-                } 
-                for level in bids
-            ]
-            
-            formatted_data["asks"] = [
-                {
-                    "price": float(level['px']),
-                    "qty": float(level['sz']),
-                    "orders": level['n']
-                } 
-                for level in asks
-            ]
-        
-        return formatted_data
 
     async def subscribe_candles(self, contract: Dict, callback: Callable, duration: str = '1 W', 
                             interval: str = '1 min'):
@@ -219,9 +292,7 @@ class HL:
             "interval": hl_interval
         }
 
-        async def forward_data(message):
-            data = self._format_candle_data(message, contract, interval)
-            await callback(data)
+        forward_data = _Forwarder(callback, self._format_candle_data, contract, interval)
         
         try:
             await self.info.subscribe(subscription=subscription, callback=forward_data)
@@ -229,31 +300,21 @@ class HL:
         except Exception as e:
             self._logger.error(f"Failed to subscribe to candles for {contract['symbol']}: {e}")
 
-    def _convert_interval_format(self, ibkr_interval: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _convert_interval_format(ibkr_interval: str) -> str:
         """Convert IBKR interval format to hyperliquid format"""
-        # Map common IBKR intervals to hyperliquid intervals
-        interval_map = {
-            '1 min': '1m',
-            '5 mins': '5m',
-            '15 mins': '15m',
-            '1 hour': '1h',
-            '4 hours': '4h',
-            '1 day': '1d',
-        }
-        
-        if ibkr_interval in interval_map:
-            return interval_map[ibkr_interval]
-        
+        hl_interval = _INTERVAL_MAP.get(ibkr_interval)
+        if hl_interval is not None:
+            return hl_interval
+
         # If not found, try a simple conversion
-        if 'min' in ibkr_interval:
-            minutes = ibkr_interval.split(' ')[0]
-            return f"{minutes}m"
-        elif 'hour' in ibkr_interval:
-            hours = ibkr_interval.split(' ')[0]
-            return f"{hours}h"
-        
+        match = _INTERVAL_RE.match(ibkr_interval)
+        if match:
+            return f"{match.group(1)}{match.group(2)[0]}"
+
         # Default to 1m if can't convert
-        self._logger.warning(f"Unknown interval format: {ibkr_interval}, defaulting to 1m")
+        logging.getLogger("hl_async.hl").warning(f"Unknown interval format: {ibkr_interval}, defaulting to 1m")
         return "1m"
 
     def _format_candle_data(self, message: Dict, contract: Dict, interval: str) -> Dict:
@@ -265,16 +326,10 @@ class HL:
         if not candle or not isinstance(candle, dict):
             return None
         
-        contract_info = {
-            "symbol": contract['symbol'],
-            "secType": "PERP",
-            "exchange": "HYPERLIQUID",
-            "multiplier": self.info.get_max_leverage(name=contract['symbol']),
-            "currency": "USD",
-        }
+        contract_info = self._contract_info(contract['symbol'])
         
         # Create a cache key for this symbol and interval
-        cache_key = f"{contract['symbol']}-{interval}"
+        cache_key = (contract['symbol'], interval)
         
         # Current candle timestamp and data
         current_time = candle['t']
@@ -287,29 +342,24 @@ class HL:
             "volume": float(candle['v'])
         }
         
-        # Initialize the cache if needed
-        if cache_key not in self._candle_cache:
-            self._candle_cache[cache_key] = []
-        
-        candles = self._candle_cache[cache_key]
+        # Keep (previous, current) as an immutable pair so it can be handed out without a copy
+        candles = self._candle_cache.get(cache_key, ())
         
         # Logic similar to the Bybit handler
         if candles and candles[-1]["time"] == current_time:
             # Update the latest candle as it's for the same time period
-            candles[-1] = current_candle
+            candles = candles[:-1] + (current_candle,)
         else:
-            # This is a new candle, add it to our list
-            candles.append(current_candle)
-            # Keep only the most recent 2 candles (or more if needed)
-            if len(candles) > 2:
-                candles.pop(0)
+            # This is a new candle; the oldest one rotates out
+            candles = (candles[-1], current_candle) if candles else (current_candle,)
+        self._candle_cache[cache_key] = candles
         
         # Create the formatted data structure
         formatted_data = {
             "contract": contract_info,
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
             "interval": interval,
-            "bars": list(candles)  # Create a copy of the list
+            "bars": candles
         }
 
         return formatted_data
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+
+import orjson
+
+from src.exchanges.hyperliquid.hl import HL
+from src.exchanges.hyperliquid.websocket_manager import (
+    ActiveSubscription,
+    WebsocketManager,
+    subscription_to_identifier,
+)
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class FakeInfo:
+    """Registers subscriptions straight into a WebsocketManager, as Info.subscribe does once connected"""
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    async def subscribe(self, subscription, callback):
+        identifier = subscription_to_identifier(subscription)
+        subscribers = self.manager.active_subscriptions.setdefault(identifier, [])
+        subscribers.append(ActiveSubscription(callback, len(subscribers) + 1))
+
+
+def make_book_frame(time_ms, bid_px="100.0", ask_px="100.5"):
+    return orjson.dumps({
+        "channel": "l2Book",
+        "data": {
+            "coin": "BTC",
+            "time": time_ms,
+            "levels": [
+                [{"px": bid_px, "sz": "1.0", "n": 1}],
+                [{"px": ask_px, "sz": "2.0", "n": 3}],
+            ],
+        },
+    })
+
+
+def test_orderbook_dedup_per_subscriber():
+    """Two subscribers on one coin each get every distinct snapshot, and neither gets a resent one"""
+    async def run():
+        hl = HL()
+        # Skip the Info lookup for max leverage
+        hl._contract_cache["BTC"] = {"symbol": "BTC"}
+
+        received = {"a": [], "b": []}
+
+        async def on_a(data):
+            received["a"].append(data)
+
+        async def on_b(data):
+            received["b"].append(data)
+
+        manager = WebsocketManager("https://api.hyperliquid.xyz")
+        hl.info = FakeInfo(manager)
+        await hl.subscribe_orderbook({"symbol": "BTC"}, on_a)
+        await hl.subscribe_orderbook({"symbol": "BTC"}, on_b)
+
+        await manager.on_message(make_book_frame(1))
+        await manager.on_message(make_book_frame(1))
+        await manager.on_message(make_book_frame(2, bid_px="100.1"))
+        return received
+
+    received = asyncio.run(run())
+    for name, frames in received.items():
+        assert len(frames) == 2, f"Subscriber {name} got {len(frames)} snapshots, expected 2"
+        assert [f["timestamp"] for f in frames] == [1, 2], f"Subscriber {name} got the wrong snapshots"
+    logger.info("Per-subscriber orderbook dedup test passed")
+
+
+def test_all():
+    """Run all tests"""
+    test_orderbook_dedup_per_subscriber()
+    logger.info("All tests completed")
+
+
+if __name__ == "__main__":
+    test_all()
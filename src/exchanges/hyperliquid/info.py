@@ -1,17 +1,40 @@
+import time
+import asyncio
+from sys import intern
+from types import MappingProxyType
+from collections import OrderedDict
+
 from .api import API
 from .types import (
     Any,
     Callable,
     Cloid,
+    Dict,
+    List,
     Meta,
     Optional,
     SpotMeta,
     SpotMetaAndAssetCtxs,
     Subscription,
+    Tuple,
     cast,
 )
 from .websocket_manager import WebsocketManager
 
+# Subscription types whose "coin" is a name that must be resolved to the exchange coin
+_COIN_SUBSCRIPTIONS = frozenset({"l2Book", "trades", "candle"})
+
+# Historical windows ending this long ago no longer change and are memoized, up to _HISTORY_CACHE_SIZE queries
+_SETTLED_HISTORY_MS = 60 * 60 * 1000
+_HISTORY_CACHE_SIZE = 512
+
+# Bodies of the argument-free /info requests; API.post only reads them
+_ALL_MIDS_REQ = {"type": "allMids"}
+_META_REQ = {"type": "meta"}
+_META_AND_ASSET_CTXS_REQ = {"type": "metaAndAssetCtxs"}
+_SPOT_META_REQ = {"type": "spotMeta"}
+_SPOT_META_AND_ASSET_CTXS_REQ = {"type": "spotMetaAndAssetCtxs"}
+
 
 class Info(API):
     def __init__(
@@ -20,6 +43,7 @@ class Info(API):
         skip_ws: Optional[bool] = False,
         meta: Optional[Meta] = None,
         spot_meta: Optional[SpotMeta] = None,
+        meta_cache_ttl: float = 60.0,
     ):
         super().__init__(base_url)
         self.ws_manager: Optional[WebsocketManager] = None
@@ -30,49 +54,124 @@ class Info(API):
         self.name_to_coin = {}
         self.asset_to_sz_decimals = {}
         self.coin_to_max_leverage = {}
+        self.name_to_max_leverage = {}
+        self.name_to_sz_decimals = {}
+        self._name_to_asset = {}
         self._initialized = False
+        self._ws_started = False
+
+        self._meta_cache_ttl = meta_cache_ttl
+        self._meta_cache: Dict[str, Tuple[float, Any]] = {}
+        self._meta_locks: Dict[str, asyncio.Lock] = {}
+        self._history_cache: OrderedDict = OrderedDict()
+        self._init_lock = asyncio.Lock()
+
+        # Metadata supplied at construction (e.g. via Exchange) saves the fetch in initialize
+        self._init_meta = meta
+        self._init_spot_meta = spot_meta
     
     async def initialize(self, meta: Optional[Meta] = None, spot_meta: Optional[SpotMeta] = None):
         """Initialize the Info instance with metadata"""
         if self._initialized:
             return
-            
-        if self.ws_manager:
-            await self.ws_manager.start()
-            
-        if meta is None:
-            meta = await self.meta()
 
-        if spot_meta is None:
+        # Concurrent callers (e.g. HL setup and a shared Exchange) wait for one load instead of repeating it
+        async with self._init_lock:
+            if not self._initialized:
+                await self._load_metadata(meta or self._init_meta, spot_meta or self._init_spot_meta)
+                self._init_meta = self._init_spot_meta = None
+
+    async def _load_metadata(self, meta: Optional[Meta], spot_meta: Optional[SpotMeta]):
+        if meta is None and spot_meta is None:
+            meta, spot_meta = await asyncio.gather(self.meta(), self.spot_meta())
+        elif meta is None:
+            meta = await self.meta()
+        elif spot_meta is None:
             spot_meta = await self.spot_meta()
 
-        # Process perp metadata
-        for asset, asset_info in enumerate(meta["universe"]):
-            self.coin_to_asset[asset_info["name"]] = asset
-            self.name_to_coin[asset_info["name"]] = asset_info["name"]
-            self.asset_to_sz_decimals[asset] = asset_info["szDecimals"]
-            if "maxLeverage" in asset_info:
-                self.coin_to_max_leverage[asset_info["name"]] = asset_info["maxLeverage"]
+        # Process perp metadata. Names are interned so probes with an identical key object
+        # (e.g. literals in strategy code) short-circuit on identity.
+        universe = meta["universe"]
+        coin_to_asset = {intern(asset_info["name"]): asset for asset, asset_info in enumerate(universe)}
+        asset_to_sz_decimals = {asset: asset_info["szDecimals"] for asset, asset_info in enumerate(universe)}
+        self.coin_to_max_leverage = {
+            intern(asset_info["name"]): asset_info["maxLeverage"] for asset_info in universe if "maxLeverage" in asset_info
+        }
 
         # Process spot metadata (assets start at 10000)
-        for spot_info in spot_meta["universe"]:
-            asset = spot_info["index"] + 10000
-            self.coin_to_asset[spot_info["name"]] = asset
-            self.name_to_coin[spot_info["name"]] = spot_info["name"]
+        tokens = spot_meta["tokens"]
+        spot_universe = spot_meta["universe"]
+        coin_to_asset.update({intern(spot_info["name"]): spot_info["index"] + 10000 for spot_info in spot_universe})
+        asset_to_sz_decimals.update(
+            {spot_info["index"] + 10000: tokens[spot_info["tokens"][0]]["szDecimals"] for spot_info in spot_universe}
+        )
+        name_to_coin = {coin: coin for coin in coin_to_asset}
+        # BASE/QUOTE aliases never shadow a listed coin or an earlier alias
+        for spot_info in spot_universe:
             base, quote = spot_info["tokens"]
-            base_info = spot_meta["tokens"][base]
-            quote_info = spot_meta["tokens"][quote]
-            self.asset_to_sz_decimals[asset] = base_info["szDecimals"]
-            name = f'{base_info["name"]}/{quote_info["name"]}'
-            if name not in self.name_to_coin:
-                self.name_to_coin[name] = spot_info["name"]
+            name_to_coin.setdefault(intern(f'{tokens[base]["name"]}/{tokens[quote]["name"]}'), intern(spot_info["name"]))
+
+        # Fused name -> value maps so hot lookups do one probe instead of two
+        self._name_to_asset = {name: coin_to_asset[coin] for name, coin in name_to_coin.items()}
+        max_leverage = self.coin_to_max_leverage
+        self.name_to_max_leverage = MappingProxyType(
+            {name: max_leverage[coin] for name, coin in name_to_coin.items() if coin in max_leverage}
+        )
+        self.name_to_sz_decimals = MappingProxyType(
+            {name: asset_to_sz_decimals[asset] for name, asset in self._name_to_asset.items()}
+        )
+
+        # The tables are fixed once built; hand callers read-only views
+        self.coin_to_asset = MappingProxyType(coin_to_asset)
+        self.name_to_coin = MappingProxyType(name_to_coin)
+        self.asset_to_sz_decimals = MappingProxyType(asset_to_sz_decimals)
+        self.coin_to_max_leverage = MappingProxyType(self.coin_to_max_leverage)
                 
         self._initialized = True
 
+    async def _post_cached(self, payload: Dict) -> Any:
+        """POST a universe request, reusing the response for meta_cache_ttl seconds"""
+        key = payload["type"]
+        entry = self._meta_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._meta_cache_ttl:
+            return entry[1]
+
+        # One refresh per key; concurrent callers wait for it instead of issuing their own
+        lock = self._meta_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._meta_cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self._meta_cache_ttl:
+                return entry[1]
+            result = await self.post("/info", payload)
+            # An unparseable body comes back as an error dict; retry it on the next call instead
+            if isinstance(result, dict) and "error" in result:
+                return result
+            self._meta_cache[key] = (time.monotonic(), result)
+            return result
+
+    async def _post_history(self, payload: Dict, end_time: int) -> Any:
+        """POST a historical query, memoizing it once its window is old enough that the data is final"""
+        if end_time > time.time() * 1000 - _SETTLED_HISTORY_MS:
+            return await self.post("/info", payload)
+
+        key = (payload["type"], *payload.get("req", payload).values())
+        cache = self._history_cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+        result = await self.post("/info", payload)
+        if isinstance(result, dict) and "error" in result:
+            return result
+        cache[key] = result
+        if len(cache) > _HISTORY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
     async def disconnect_websocket(self):
         if self.ws_manager is None:
             raise RuntimeError("Cannot call disconnect_websocket since skip_ws was used")
-        else:
+        elif self._ws_started:
             await self.ws_manager.stop()
 
     async def user_state(self, address: str) -> Any:
@@ -188,7 +287,7 @@ class Info(API):
               any other coins which are trading: float string
             }
         """
-        return await self.post("/info", {"type": "allMids"})
+        return await self.post("/info", _ALL_MIDS_REQ)
 
     async def user_fills(self, address: str) -> Any:
         """Retrieve a given user's fills.
@@ -268,7 +367,7 @@ class Info(API):
                 ]
             }
         """
-        return cast(Meta, await self.post("/info", {"type": "meta"}))
+        return cast(Meta, await self._post_cached(_META_REQ))
 
     async def meta_and_asset_ctxs(self) -> Any:
         """Retrieve exchange MetaAndAssetCtxs
@@ -303,7 +402,7 @@ class Info(API):
                 ...
             ]
         """
-        return await self.post("/info", {"type": "metaAndAssetCtxs"})
+        return await self.post("/info", _META_AND_ASSET_CTXS_REQ)
 
     async def spot_meta(self) -> SpotMeta:
         """Retrieve exchange spot metadata
@@ -334,7 +433,7 @@ class Info(API):
                 ]
             }
         """
-        return cast(SpotMeta, await self.post("/info", {"type": "spotMeta"}))
+        return cast(SpotMeta, await self._post_cached(_SPOT_META_REQ))
 
     async def spot_meta_and_asset_ctxs(self) -> SpotMetaAndAssetCtxs:
         """Retrieve exchange spot asset contexts
@@ -376,7 +475,7 @@ class Info(API):
                 ]
             ]
         """
-        return cast(SpotMetaAndAssetCtxs, await self.post("/info", {"type": "spotMetaAndAssetCtxs"}))
+        return cast(SpotMetaAndAssetCtxs, await self.post("/info", _SPOT_META_AND_ASSET_CTXS_REQ))
 
     async def funding_history(self, name: str, startTime: int, endTime: Optional[int] = None) -> Any:
         """Retrieve funding history for a given coin
@@ -399,10 +498,13 @@ class Info(API):
                 ...
             ]
         """
-        coin = self.name_to_coin[name]
+        return await self.funding_history_by_coin(self.name_to_coin[name], startTime, endTime)
+
+    async def funding_history_by_coin(self, coin: str, startTime: int, endTime: Optional[int] = None) -> Any:
+        """funding_history for an already resolved coin; polling loops can look up name_to_coin once"""
         if endTime is not None:
-            return await self.post(
-                "/info", {"type": "fundingHistory", "coin": coin, "startTime": startTime, "endTime": endTime}
+            return await self._post_history(
+                {"type": "fundingHistory", "coin": coin, "startTime": startTime, "endTime": endTime}, endTime
             )
         return await self.post("/info", {"type": "fundingHistory", "coin": coin, "startTime": startTime})
 
@@ -449,7 +551,11 @@ class Info(API):
                 time: int
             }
         """
-        return await self.post("/info", {"type": "l2Book", "coin": self.name_to_coin[name]})
+        return await self.l2_snapshot_by_coin(self.name_to_coin[name])
+
+    async def l2_snapshot_by_coin(self, coin: str) -> Any:
+        """l2_snapshot for an already resolved coin; polling loops can look up name_to_coin once"""
+        return await self.post("/info", {"type": "l2Book", "coin": coin})
 
     async def candles_snapshot(self, name: str, interval: str, startTime: int, endTime: int) -> Any:
         """Retrieve candles snapshot for a given coin
@@ -479,8 +585,40 @@ class Info(API):
                 ...
             ]
         """
-        req = {"coin": self.name_to_coin[name], "interval": interval, "startTime": startTime, "endTime": endTime}
-        return await self.post("/info", {"type": "candleSnapshot", "req": req})
+        return await self.candles_snapshot_by_coin(self.name_to_coin[name], interval, startTime, endTime)
+
+    async def candles_snapshot_by_coin(self, coin: str, interval: str, startTime: int, endTime: int) -> Any:
+        """candles_snapshot for an already resolved coin; polling loops can look up name_to_coin once"""
+        req = {"coin": coin, "interval": interval, "startTime": startTime, "endTime": endTime}
+        return await self._post_history({"type": "candleSnapshot", "req": req}, endTime)
+
+    async def l2_snapshots(self, names: List[str], max_inflight: int = 8) -> List[Any]:
+        """Retrieve L2 snapshots for several coins concurrently, in the order of names"""
+        payloads = [{"type": "l2Book", "coin": self.name_to_coin[name]} for name in names]
+        return await self._post_many(payloads, max_inflight)
+
+    async def candles_snapshots(
+        self, requests: List[Tuple[str, str, int, int]], max_inflight: int = 8
+    ) -> List[Any]:
+        """Retrieve candle snapshots for several (name, interval, startTime, endTime) requests concurrently"""
+        payloads = [
+            {
+                "type": "candleSnapshot",
+                "req": {"coin": self.name_to_coin[name], "interval": interval, "startTime": startTime, "endTime": endTime},
+            }
+            for name, interval, startTime, endTime in requests
+        ]
+        return await self._post_many(payloads, max_inflight)
+
+    async def _post_many(self, payloads: List[Dict], max_inflight: int) -> List[Any]:
+        # Names are resolved by the callers before anything is sent, so an unknown coin fails fast
+        semaphore = asyncio.Semaphore(max_inflight)
+
+        async def bounded_post(payload: Dict) -> Any:
+            async with semaphore:
+                return await self.post("/info", payload)
+
+        return await asyncio.gather(*(bounded_post(payload) for payload in payloads))
 
     async def user_fees(self, address: str) -> Any:
         """Retrieve the volume of trading activity associated with a user.
@@ -591,16 +729,34 @@ class Info(API):
         return await self.post("/info", {"type": "userToMultiSigSigners", "user": multi_sig_user})
 
     async def subscribe(self, subscription: Subscription, callback: Callable[[Any], None]) -> int:
-        if subscription["type"] == "l2Book" or subscription["type"] == "trades" or subscription["type"] == "candle":
-            subscription["coin"] = self.name_to_coin[subscription["coin"]]
+        subscription = self._resolve_subscription(subscription)
+        await self._ensure_ws("subscribe")
+        return await self.ws_manager.subscribe(subscription, callback)
+
+    async def subscribe_many(self, subscriptions: List[Subscription], callback: Callable[[Any], None]) -> List[int]:
+        """Subscribe one callback to several channels, resolving every coin before anything is sent"""
+        subscriptions = [self._resolve_subscription(subscription) for subscription in subscriptions]
+        await self._ensure_ws("subscribe_many")
+        # The protocol has no multi-subscribe message; sends don't wait for an ack, so these go out back to back
+        return [await self.ws_manager.subscribe(subscription, callback) for subscription in subscriptions]
+
+    def _resolve_subscription(self, subscription: Subscription) -> Subscription:
+        # Derive a copy rather than rewriting the caller's dict, which may be reused with the original name
+        if subscription["type"] in _COIN_SUBSCRIPTIONS:
+            return {**subscription, "coin": self.name_to_coin[subscription["coin"]]}
+        return subscription
+
+    async def _ensure_ws(self, caller: str) -> None:
         if self.ws_manager is None:
-            raise RuntimeError("Cannot call subscribe since skip_ws was used")
-        else:
-            return await self.ws_manager.subscribe(subscription, callback)
+            raise RuntimeError(f"Cannot call {caller} since skip_ws was used")
+        if not self._ws_started:
+            # Connect on first use so REST-only instances never open a socket. The flag is set
+            # before the await, so concurrent first subscribers can't start a second connection.
+            self._ws_started = True
+            await self.ws_manager.start()
 
     async def unsubscribe(self, subscription: Subscription, subscription_id: int) -> bool:
-        if subscription["type"] == "l2Book" or subscription["type"] == "trades" or subscription["type"] == "candle":
-            subscription["coin"] = self.name_to_coin[subscription["coin"]]
+        subscription = self._resolve_subscription(subscription)
         if self.ws_manager is None:
             raise RuntimeError("Cannot call unsubscribe since skip_ws was used")
         else:
@@ -608,8 +764,8 @@ class Info(API):
 
     def name_to_asset(self, name: str) -> int:
         """Convert a name to an asset ID"""
-        return self.coin_to_asset[self.name_to_coin[name]]
+        return self._name_to_asset[name]
 
     def get_max_leverage(self, name: str) -> Optional[int]:
         """Get the max leverage for a given coin name"""
-        return self.coin_to_max_leverage.get(self.name_to_coin.get(name, name), None)
\ No newline at end of file
+        return self.name_to_max_leverage.get(name)
\ No newline at end of file
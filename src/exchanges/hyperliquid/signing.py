@@ -1,8 +1,9 @@
 import time
+import functools
 from decimal import Decimal
 
 import msgpack
-from eth_account.messages import encode_typed_data
+from eth_account.messages import SignableMessage, encode_typed_data
 from eth_utils import keccak, to_hex
 
 from .types import Cloid, Literal, NotRequired, Optional, TypedDict, Union
@@ -134,8 +135,25 @@ def address_to_bytes(address):
     return bytes.fromhex(address[2:] if address.startswith("0x") else address)
 
 
+_SCALAR_TYPES = (str, int, bool, type(None))
+
+
+@functools.lru_cache(maxsize=256)
+def _pack_flat_action(frozen: tuple) -> bytes:
+    return msgpack.packb({k: v for k, _, v in frozen})
+
+
+def pack_action(action) -> bytes:
+    # Flat actions like scheduleCancel and updateLeverage repeat with only the nonce changing, and the
+    # nonce is appended after the packed body, so their encoding can be reused. The value type is part
+    # of the key since True and 1 compare equal but pack differently.
+    if type(action) is dict and all(type(v) in _SCALAR_TYPES for v in action.values()):
+        return _pack_flat_action(tuple((k, type(v), v) for k, v in action.items()))
+    return msgpack.packb(action)
+
+
 def action_hash(action, vault_address, nonce):
-    data = msgpack.packb(action)
+    data = pack_action(action)
     data += nonce.to_bytes(8, "big")
     if vault_address is None:
         data += b"\x00"
@@ -177,6 +195,29 @@ def sign_l1_action(wallet, action, active_pool, nonce, is_mainnet):
     return sign_inner(wallet, data)
 
 
+def compute_l1_domain_separator() -> bytes:
+    """EIP-712 domain hash used by sign_l1_action; it is the same on mainnet and testnet"""
+    return keccak(
+        keccak(b"EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+        + keccak(b"Exchange")
+        + keccak(b"1")
+        + (1337).to_bytes(32, "big")
+        + bytes(32)
+    )
+
+
+L1_DOMAIN_SEPARATOR = compute_l1_domain_separator()
+AGENT_TYPE_HASH = keccak(b"Agent(string source,bytes32 connectionId)")
+AGENT_SOURCE_HASHES = {True: keccak(b"a"), False: keccak(b"b")}
+
+
+def sign_l1_action_fast(wallet, action, active_pool, nonce, is_mainnet):
+    """sign_l1_action with the precomputed domain separator and Agent type hash instead of re-encoding them per call"""
+    hash = action_hash(action, active_pool, nonce)
+    struct_hash = keccak(AGENT_TYPE_HASH + AGENT_SOURCE_HASHES[bool(is_mainnet)] + hash)
+    return sign_signable(wallet, SignableMessage(b"\x01", L1_DOMAIN_SEPARATOR, struct_hash))
+
+
 def sign_user_signed_action(wallet, action, payload_types, primary_type, is_mainnet):
     action["signatureChainId"] = "0x66eee"
     action["hyperliquidChain"] = "Mainnet" if is_mainnet else "Testnet"
@@ -358,7 +399,10 @@ def sign_approve_builder_fee(wallet, action, is_mainnet):
 
 
 def sign_inner(wallet, data):
-    structured_data = encode_typed_data(full_message=data)
+    return sign_signable(wallet, encode_typed_data(full_message=data))
+
+
+def sign_signable(wallet, structured_data):
     signed = wallet.sign_message(structured_data)
     return {"r": to_hex(signed["r"]), "s": to_hex(signed["s"]), "v": signed["v"]}
 
@@ -0,0 +1,87 @@
+import logging
+
+import eth_account
+import msgpack
+
+from src.exchanges.hyperliquid.signing import (
+    _pack_flat_action,
+    order_request_to_order_wire,
+    order_wires_to_order_action,
+    pack_action,
+    sign_l1_action,
+    sign_l1_action_fast,
+)
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+WALLET = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+VAULT = "0x1719884eb866cb12b2287399b15f7db5e7d775ea"
+NONCE = 1700000000000
+
+
+def make_order_action():
+    order = {
+        "coin": "BTC",
+        "is_buy": True,
+        "sz": 0.01,
+        "limit_px": 65000.0,
+        "order_type": {"limit": {"tif": "Gtc"}},
+        "reduce_only": False,
+    }
+    return order_wires_to_order_action([order_request_to_order_wire(order, 0)])
+
+
+def test_sign_l1_action_fast():
+    """The precomputed EIP-712 hashing signs exactly what the full typed-data encoding signs"""
+    actions = [make_order_action(), {"type": "scheduleCancel", "time": NONCE + 60_000}]
+
+    for action in actions:
+        for is_mainnet in (True, False):
+            for vault in (None, VAULT):
+                expected = sign_l1_action(WALLET, action, vault, NONCE, is_mainnet)
+                got = sign_l1_action_fast(WALLET, action, vault, NONCE, is_mainnet)
+                assert got == expected, (
+                    f"Signatures differ for {action['type']} (mainnet={is_mainnet}, vault={vault}): {got} != {expected}"
+                )
+    logger.info("Fast L1 signing test passed")
+
+
+def test_pack_action():
+    """pack_action is byte-identical to msgpack.packb, whether or not the flat-action cache is used"""
+    _pack_flat_action.cache_clear()
+    flat_actions = [
+        {"type": "updateLeverage", "asset": 0, "isCross": True, "leverage": 10},
+        # True and 1 compare equal but must not share a cache entry
+        {"type": "updateLeverage", "asset": 0, "isCross": 1, "leverage": 10},
+        {"type": "scheduleCancel", "time": None},
+        # Same items in a different order pack to different bytes
+        {"time": None, "type": "scheduleCancel"},
+    ]
+
+    for action in flat_actions:
+        for _ in range(2):
+            got = pack_action(action)
+            assert got == msgpack.packb(action), f"pack_action({action}) differs from msgpack.packb"
+    assert pack_action(flat_actions[0]) != pack_action(flat_actions[1]), "True and 1 packed identically"
+    assert pack_action(flat_actions[2]) != pack_action(flat_actions[3]), "Key order was not preserved"
+
+    cache_size = _pack_flat_action.cache_info().currsize
+    assert cache_size == len(flat_actions), f"Expected {len(flat_actions)} cached bodies, got {cache_size}"
+
+    nested = make_order_action()
+    assert pack_action(nested) == msgpack.packb(nested), "Nested action differs from msgpack.packb"
+    assert _pack_flat_action.cache_info().currsize == cache_size, "Nested action should bypass the cache"
+    logger.info("pack_action test passed")
+
+
+def test_all():
+    """Run all tests"""
+    test_sign_l1_action_fast()
+    test_pack_action()
+    logger.info("All tests completed")
+
+
+if __name__ == "__main__":
+    test_all()
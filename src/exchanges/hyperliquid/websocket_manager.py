@@ -1,7 +1,7 @@
 import orjson
 import logging
 import asyncio
-from collections import defaultdict
+from sys import intern
 
 import websockets
 
@@ -9,42 +9,68 @@ from .types import Any, Callable, Dict, List, Tuple, NamedTuple, Optional, Subsc
 
 ActiveSubscription = NamedTuple("ActiveSubscription", [("callback", Callable[[Any], None]), ("subscription_id", int)])
 
+_PING = orjson.dumps({"method": "ping"})
+# Only the subscription varies, so the envelope is spliced around it rather than encoded per call
+_SUBSCRIBE_PREFIX = b'{"method":"subscribe","subscription":'
+_UNSUBSCRIBE_PREFIX = b'{"method":"unsubscribe","subscription":'
+_ENVELOPE_SUFFIX = b'}'
+_PING_INTERVAL = 50
+
+_SUBSCRIPTION_IDENTIFIERS: Dict[str, Callable[[Subscription], str]] = {
+    "allMids": lambda s: "allMids",
+    "l2Book": lambda s: f'l2Book:{s["coin"].lower()}',
+    "trades": lambda s: f'trades:{s["coin"].lower()}',
+    "userEvents": lambda s: "userEvents",
+    "userFills": lambda s: f'userFills:{s["user"].lower()}',
+    "candle": lambda s: f'candle:{s["coin"].lower()},{s["interval"]}',
+    "orderUpdates": lambda s: "orderUpdates",
+    "userFundings": lambda s: f'userFundings:{s["user"].lower()}',
+    "userNonFundingLedgerUpdates": lambda s: f'userNonFundingLedgerUpdates:{s["user"].lower()}',
+    "webData2": lambda s: f'webData2:{s["user"].lower()}'
+}
+
+_WS_MSG_IDENTIFIERS: Dict[str, Callable[[WsMsg], Optional[str]]] = {
+    "allMids": lambda msg: "allMids",
+    "user": lambda msg: "userEvents",
+    "userFills": lambda msg: f'userFills:{msg["data"]["user"].lower()}',
+    "candle": lambda msg: f'candle:{msg["data"]["s"].lower()},{msg["data"]["i"]}',
+    "orderUpdates": lambda msg: "orderUpdates",
+    "userFundings": lambda msg: f'userFundings:{msg["data"]["user"].lower()}',
+    "userNonFundingLedgerUpdates": lambda msg: f'userNonFundingLedgerUpdates:{msg["data"]["user"].lower()}',
+    "webData2": lambda msg: f'webData2:{msg["data"]["user"].lower()}'
+}
+
+# Coin -> identifier for the hot channels; bounded by the number of listed coins
+_L2BOOK_IDENTIFIERS: Dict[str, str] = {}
+_TRADES_IDENTIFIERS: Dict[str, str] = {}
+
 def subscription_to_identifier(subscription: Subscription) -> str:
-    mapping = {
-        "allMids": lambda s: "allMids",
-        "l2Book": lambda s: f'l2Book:{s["coin"].lower()}',
-        "trades": lambda s: f'trades:{s["coin"].lower()}',
-        "userEvents": lambda s: "userEvents",
-        "userFills": lambda s: f'userFills:{s["user"].lower()}',
-        "candle": lambda s: f'candle:{s["coin"].lower()},{s["interval"]}',
-        "orderUpdates": lambda s: "orderUpdates",
-        "userFundings": lambda s: f'userFundings:{s["user"].lower()}',
-        "userNonFundingLedgerUpdates": lambda s: f'userNonFundingLedgerUpdates:{s["user"].lower()}',
-        "webData2": lambda s: f'webData2:{s["user"].lower()}'
-    }
-    
-    return mapping[subscription["type"]](subscription)
+    # Interned so the active_subscriptions key is the same object ws_msg_to_identifier hands back
+    return intern(_SUBSCRIPTION_IDENTIFIERS[subscription["type"]](subscription))
 
 def ws_msg_to_identifier(ws_msg: WsMsg) -> Optional[str]:
     channel = ws_msg["channel"]
     
+    # Book and trade frames dominate the stream, so they skip the table and reuse one identifier per coin
+    if channel == "l2Book":
+        coin = ws_msg["data"]["coin"]
+        identifier = _L2BOOK_IDENTIFIERS.get(coin)
+        if identifier is None:
+            identifier = _L2BOOK_IDENTIFIERS[coin] = intern(f'l2Book:{coin.lower()}')
+        return identifier
+    if channel == "trades":
+        data = ws_msg["data"]
+        if len(data) == 0:
+            return None
+        coin = data[0]["coin"]
+        identifier = _TRADES_IDENTIFIERS.get(coin)
+        if identifier is None:
+            identifier = _TRADES_IDENTIFIERS[coin] = intern(f'trades:{coin.lower()}')
+        return identifier
     if channel == "pong":
         return "pong"
     
-    mapping = {
-        "allMids": lambda msg: "allMids",
-        "l2Book": lambda msg: f'l2Book:{msg["data"]["coin"].lower()}',
-        "trades": lambda msg: f'trades:{msg["data"][0]["coin"].lower()}' if len(msg["data"]) > 0 else None,
-        "user": lambda msg: "userEvents",
-        "userFills": lambda msg: f'userFills:{msg["data"]["user"].lower()}',
-        "candle": lambda msg: f'candle:{msg["data"]["s"].lower()},{msg["data"]["i"]}',
-        "orderUpdates": lambda msg: "orderUpdates",
-        "userFundings": lambda msg: f'userFundings:{msg["data"]["user"].lower()}',
-        "userNonFundingLedgerUpdates": lambda msg: f'userNonFundingLedgerUpdates:{msg["data"]["user"].lower()}',
-        "webData2": lambda msg: f'webData2:{msg["data"]["user"].lower()}'
-    }
-    
-    handler = mapping.get(channel)
+    handler = _WS_MSG_IDENTIFIERS.get(channel)
     if handler:
         return handler(ws_msg)
     return None
@@ -55,17 +81,20 @@ class WebsocketManager:
         self.subscription_id_counter = 0
         self.ws_ready = False
         self.queued_subscriptions: List[Tuple[Subscription, ActiveSubscription]] = []
-        self.active_subscriptions: Dict[str, List[ActiveSubscription]] = defaultdict(list)
+        self.active_subscriptions: Dict[str, List[ActiveSubscription]] = {}
+        # Identifier -> subscription payload, so live channels can be re-sent after a reconnect
+        self.subscription_payloads: Dict[str, Subscription] = {}
         self.ws_url = "ws" + base_url[len("http"):] + "/ws"
         self.websocket = None
         self.stop_event = asyncio.Event()
-        self.ping_task = None
+        self.ping_handle: Optional[asyncio.TimerHandle] = None
+        self.ping_send: Optional[asyncio.Task] = None
         self.ws_task = None
         
     async def start(self):
         """Start the websocket connection and ping loop"""
         self.ws_task = asyncio.create_task(self.run_forever())
-        self.ping_task = asyncio.create_task(self.send_ping())
+        self._schedule_ping()
         
     async def run_forever(self):
         """Maintain the websocket connection"""
@@ -75,6 +104,10 @@ class WebsocketManager:
                     self.websocket = websocket
                     self.ws_ready = True
                     
+                    # The server forgets subscriptions with the old connection, so replay the live ones
+                    for subscription in list(self.subscription_payloads.values()):
+                        await self._send_subscription(_SUBSCRIBE_PREFIX, subscription)
+                    
                     # Process queued subscriptions
                     for subscription, active_subscription in self.queued_subscriptions:
                         await self.subscribe(
@@ -94,7 +127,8 @@ class WebsocketManager:
                             
             except Exception as e:
                 logging.error(f"WebSocket error: {e}")
-                self.ws_ready = False
+            # Subscribe calls made before the next connect are queued rather than sent on the closed socket
+            self.ws_ready = False
                 
             if not self.stop_event.is_set():
                 # Wait before reconnecting
@@ -106,25 +140,34 @@ class WebsocketManager:
         if self.websocket:
             await self.websocket.close()
         
-        if self.ping_task:
-            self.ping_task.cancel()
+        if self.ping_handle:
+            self.ping_handle.cancel()
         if self.ws_task:
             await self.ws_task
             
+    def _schedule_ping(self):
+        self.ping_handle = asyncio.get_running_loop().call_later(_PING_INTERVAL, self._on_ping_timer)
+
+    def _on_ping_timer(self):
+        if self.stop_event.is_set():
+            logging.debug("Websocket ping sender stopped")
+            return
+        if self.ws_ready and self.websocket:
+            # Keep a reference so the send isn't garbage collected mid-flight
+            self.ping_send = asyncio.create_task(self.send_ping())
+        self._schedule_ping()
+
     async def send_ping(self):
-        """Send periodic pings to keep the connection alive"""
-        while not self.stop_event.is_set():
-            try:
-                if self.ws_ready and self.websocket:
-                    logging.debug("Websocket sending ping")
-                    await self.websocket.send(orjson.dumps({"method": "ping"}).decode('utf-8'))
-            except Exception as e:
-                logging.error(f"Error sending ping: {e}")
-                
-            await asyncio.sleep(50)
-        
-        logging.debug("Websocket ping sender stopped")
+        """Send one ping to keep the connection alive"""
+        try:
+            logging.debug("Websocket sending ping")
+            await self.websocket.send(_PING, text=True)
+        except Exception as e:
+            logging.error(f"Error sending ping: {e}")
             
+    async def _send_subscription(self, prefix: bytes, subscription: Subscription):
+        await self.websocket.send(prefix + orjson.dumps(subscription) + _ENVELOPE_SUFFIX, text=True)
+
     async def on_message(self, message):
         """Handle incoming websocket messages"""
         if message == "Websocket connection established.":
@@ -143,7 +186,8 @@ class WebsocketManager:
             logging.debug("Websocket not handling empty message")
             return
             
-        active_subscriptions = self.active_subscriptions[identifier]
+        # .get so frames for unknown identifiers don't leave empty entries behind
+        active_subscriptions = self.active_subscriptions.get(identifier)
         if not active_subscriptions:
             print("Websocket message from an unexpected subscription:", message, identifier)
         else:
@@ -166,11 +210,12 @@ class WebsocketManager:
             identifier = subscription_to_identifier(subscription)
             
             # Special handling for exclusive subscriptions
-            if identifier in ("userEvents", "orderUpdates") and self.active_subscriptions[identifier]:
+            if identifier in ("userEvents", "orderUpdates") and self.active_subscriptions.get(identifier):
                 raise NotImplementedError(f"Cannot subscribe to {identifier} multiple times")
                 
-            self.active_subscriptions[identifier].append(ActiveSubscription(callback, subscription_id))
-            await self.websocket.send(orjson.dumps({"method": "subscribe", "subscription": subscription}).decode('utf-8'))
+            self.active_subscriptions.setdefault(identifier, []).append(ActiveSubscription(callback, subscription_id))
+            self.subscription_payloads[identifier] = subscription
+            await self._send_subscription(_SUBSCRIBE_PREFIX, subscription)
             
         return subscription_id
         
@@ -180,11 +225,15 @@ class WebsocketManager:
             raise NotImplementedError("Can't unsubscribe before websocket connected")
             
         identifier = subscription_to_identifier(subscription)
-        active_subscriptions = self.active_subscriptions[identifier]
+        active_subscriptions = self.active_subscriptions.get(identifier, [])
         new_active_subscriptions = [x for x in active_subscriptions if x.subscription_id != subscription_id]
         
         if not new_active_subscriptions:
-            await self.websocket.send(orjson.dumps({"method": "unsubscribe", "subscription": subscription}).decode('utf-8'))
+            await self._send_subscription(_UNSUBSCRIBE_PREFIX, subscription)
             
-        self.active_subscriptions[identifier] = new_active_subscriptions
+        if new_active_subscriptions:
+            self.active_subscriptions[identifier] = new_active_subscriptions
+        else:
+            self.active_subscriptions.pop(identifier, None)
+            self.subscription_payloads.pop(identifier, None)
         return len(active_subscriptions) != len(new_active_subscriptions)
\ No newline at end of file
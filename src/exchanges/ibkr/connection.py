@@ -7,7 +7,9 @@ class Connection(asyncio.Protocol):
         self._data_callbacks: List[Callable[[bytes], Any]] = []
         self._disconnected_callbacks: List[Callable[[str], Any]] = []
 
-        self.data_queue: asyncio.Queue = asyncio.Queue()
+        # Pull-mode buffer for get_data(); one growing bytearray instead of a queue item per TCP chunk
+        self._buf = bytearray()
+        self._data_event = asyncio.Event()
 
         self.disconnect_future: Optional[asyncio.Future] = None
         
@@ -54,10 +56,19 @@ class Connection(asyncio.Protocol):
             self.disconnect_future.set_result(msg)
     
     def data_received(self, data: bytes) -> None:
-        self.data_queue.put_nowait(data)
+        callbacks = self._data_callbacks
+        if callbacks:
+            # Client registers exactly one callback, so call it without setting up a loop
+            if len(callbacks) == 1:
+                callbacks[0](data)
+            else:
+                for callback in callbacks:
+                    callback(data)
+            return
         
-        for callback in self._data_callbacks:
-            callback(data)
+        # Nothing consumes the stream by callback, so keep it for get_data()
+        self._buf += data
+        self._data_event.set()
 
     def add_data_callback(self, callback: Callable[[bytes], Any]) -> None:
         self._data_callbacks.append(callback)
@@ -72,4 +83,10 @@ class Connection(asyncio.Protocol):
         self._disconnected_callbacks.remove(callback)
     
     async def get_data(self) -> bytes:
-        return await self.data_queue.get()
\ No newline at end of file
+        """Wait for and return everything received since the last call (pull mode, no data callbacks)"""
+        while not self._buf:
+            self._data_event.clear()
+            await self._data_event.wait()
+        chunk = bytes(self._buf)
+        self._buf.clear()
+        return chunk
\ No newline at end of file
@@ -7,6 +7,7 @@ from typing import Any, Awaitable, Dict, Iterator, List, Optional, Union, Callab
 
 from enum import Flag, auto
 
+from src.exchanges.base import register_exchange
 from src.exchanges.ibkr import util
 from .client import Client
 from .contract import Contract, ContractDescription, ContractDetails, Stock, Option, Future, Crypto
@@ -73,6 +74,7 @@ StartupFetchALL = (
 )
 
 
+@register_exchange("ib")
 class IB:
     """
     Provides both a blocking and an asynchronous interface
@@ -263,6 +265,8 @@ class IB:
         "timeoutEvent",
     )
 
+    SYNC_DISCONNECT = True
+
     RequestTimeout: float = 0
     RaiseRequestErrors: bool = False
     MaxSyncedSubAccounts: int = 50
@@ -1578,8 +1582,6 @@ class IB:
         """
         reqId = self.client.getReqId()
         ticker = self.wrapper.startTicker(reqId, contract, "mktDepth")
-        ticker.domBids.clear()
-        ticker.domAsks.clear()
         ticker.domBidsDict.clear()
         ticker.domAsksDict.clear()
         self.client.reqMktDepth(reqId, contract, numRows, isSmartDepth, mktDepthOptions)
@@ -1605,9 +1607,9 @@ class IB:
         timestamp = int(ticker.time.timestamp() * 1000) if ticker.time else int(time.time() * 1000)
         
         # Sort bids by price descending (highest bid first)
-        sorted_bids = sorted(ticker.domBids, key=lambda x: x.price, reverse=True)
+        sorted_bids = sorted(ticker.domBidsDict.values(), key=lambda x: x.price, reverse=True)
         # Sort asks by price ascending (lowest ask first)
-        sorted_asks = sorted(ticker.domAsks, key=lambda x: x.price)
+        sorted_asks = sorted(ticker.domAsksDict.values(), key=lambda x: x.price)
         
         formatted_data = {
             "contract": contract_info,
@@ -1633,8 +1635,6 @@ class IB:
 
             # clear market depth state from live ticker since it is not longer
             # being updated after the cancel request.
-            ticker.domBids.clear()
-            ticker.domAsks.clear()
             ticker.domBidsDict.clear()
             ticker.domAsksDict.clear()
         else:
@@ -24,22 +24,30 @@ class Op:
     
     def __init__(self, source=None):
         self._source = source
-        self._listeners = []
+        self._listeners_plain = []
+        self._listeners_args = []
         if source:
             source.connect(self.on_source)
     
     def connect(self, callback, *args):
         """Connect a callback to this operator."""
-        self._listeners.append((callback, args))
+        if args:
+            self._listeners_args.append((callback, args))
+        else:
+            self._listeners_plain.append(callback)
         return self
     
     def emit(self, *args):
         """Emit event to all listeners."""
-        for callback, cb_args in self._listeners:
-            if cb_args:
-                callback(*(args + cb_args))
-            else:
-                callback(*args)
+        plain = self._listeners_plain
+        # A bar series usually has exactly one consumer
+        if len(plain) == 1 and not self._listeners_args:
+            plain[0](*args)
+            return
+        for callback in plain:
+            callback(*args)
+        for callback, cb_args in self._listeners_args:
+            callback(*(args + cb_args))
     
     def on_source(self, *args):
         """Called when the source emits an event."""
@@ -47,11 +55,17 @@ class Op:
     
     def set_done(self):
         """Mark this operator as done."""
-        self._listeners = []
+        self._listeners_plain = []
+        self._listeners_args = []
+
 
+class _TickerEvents:
+    # Non-field slot for the event set up in Ticker.__post_init__
+    __slots__ = ("updateEvent",)
 
-@dataclass
-class Ticker:
+
+@dataclass(slots=True)
+class Ticker(_TickerEvents):
     """
     Current market data such as bid, ask, last price, etc. for a contract.
 
@@ -59,8 +73,9 @@ class Ticker:
     the ``ticks`` list.
 
     Streaming level-2 ticks of type :class:`.MktDepthData` are stored in the
-    ``domTicks`` list. The order book (DOM) is available as lists of
-    :class:`.DOMLevel` in ``domBids`` and ``domAsks``.
+    ``domTicks`` list. The order book (DOM) is kept in ``domBidsDict`` and
+    ``domAsksDict`` keyed by position, and is also available as lists of
+    :class:`.DOMLevel` through the ``domBids`` and ``domAsks`` properties.
 
     Streaming tick-by-tick ticks are stored in ``tickByTicks``.
 
@@ -135,9 +150,7 @@ class Ticker:
     tickByTicks: List[
         Union[TickByTickAllLast, TickByTickBidAsk, TickByTickMidPoint]
     ] = field(default_factory=list)
-    domBids: List[DOMLevel] = field(default_factory=list)
     domBidsDict: dict[int, DOMLevel] = field(default_factory=dict)
-    domAsks: List[DOMLevel] = field(default_factory=list)
     domAsksDict: dict[int, DOMLevel] = field(default_factory=dict)
     domTicks: List[MktDepthData] = field(default_factory=list)
     bidGreeks: Optional[OptionComputation] = None
@@ -163,6 +176,16 @@ class Ticker:
     __repr__ = dataclassRepr
     __str__ = dataclassRepr
 
+    @property
+    def domBids(self) -> List[DOMLevel]:
+        """Bid DOM levels as a list, built from ``domBidsDict`` on access."""
+        return list(self.domBidsDict.values())
+
+    @property
+    def domAsks(self) -> List[DOMLevel]:
+        """Ask DOM levels as a list, built from ``domAsksDict`` on access."""
+        return list(self.domAsksDict.values())
+
     def hasBidAsk(self) -> bool:
         """See if this ticker has a valid bid and ask."""
         return (
@@ -227,12 +250,15 @@ class Tickfilter(Op):
 
     def __init__(self, tickTypes, source=None):
         Op.__init__(self, source)
-        self._tickTypes = set(tickTypes)
+        self._tickTypes = frozenset(tickTypes)
 
     def on_source(self, ticker):
-        for t in ticker.ticks:
-            if t.tickType in self._tickTypes:
-                self.emit(t.time, t.price, t.size)
+        emit = self.emit
+        tickTypes = self._tickTypes
+        # TickData is a NamedTuple, so unpack it rather than look up each field
+        for time, tickType, price, size in ticker.ticks:
+            if tickType in tickTypes:
+                emit(time, price, size)
 
     def timebars(self, timer: Event) -> "TimeBars":
         """
@@ -281,7 +307,7 @@ class Midpoints(Tickfilter):
             self.emit(ticker.time, ticker.midpoint(), 0)
 
 
-@dataclass
+@dataclass(slots=True)
 class Bar:
     time: Optional[datetime]
     open: float = nan
@@ -307,6 +333,7 @@ class TimeBars(Op):
     def __init__(self, timer, source=None):
         Op.__init__(self, source)
         self._timer = timer
+        self._partialUpdates = True
         self.bars = BarList()
         
         # Connect to the timer event
@@ -328,7 +355,16 @@ class TimeBars(Op):
         bar.close = price
         bar.volume += size
         bar.count += 1
-        self.bars.updateEvent.emit(self.bars, False)
+        if self._partialUpdates:
+            self.bars.updateEvent.emit(self.bars, False)
+
+    def disablePartialUpdates(self) -> "TimeBars":
+        """
+        Stop emitting ``bars.updateEvent(bars, False)`` on every tick that
+        updates the bar in progress, so only completed bars are emitted.
+        """
+        self._partialUpdates = False
+        return self
 
     def _on_timer(self, time):
         if self.bars:
@@ -349,19 +385,22 @@ class TickBars(Op):
         self.bars = BarList()
 
     def on_source(self, time, price, size):
-        if not self.bars or self.bars[-1].count == self._count:
+        bars = self.bars
+        bar = bars[-1] if bars else None
+        if bar is None or bar.count == self._count:
             bar = Bar(time, price, price, price, price, size, 1)
-            self.bars.append(bar)
+            bars.append(bar)
         else:
-            bar = self.bars[-1]
-            bar.high = max(bar.high, price)
-            bar.low = min(bar.low, price)
+            if price > bar.high:
+                bar.high = price
+            elif price < bar.low:
+                bar.low = price
             bar.close = price
             bar.volume += size
             bar.count += 1
         if bar.count == self._count:
-            self.bars.updateEvent.emit(self.bars, True)
-            self.emit(self.bars)
+            bars.updateEvent.emit(bars, True)
+            self.emit(bars)
 
 
 class VolumeBars(Op):
@@ -373,16 +412,19 @@ class VolumeBars(Op):
         self.bars = BarList()
 
     def on_source(self, time, price, size):
-        if not self.bars or self.bars[-1].volume >= self._volume:
+        bars = self.bars
+        bar = bars[-1] if bars else None
+        if bar is None or bar.volume >= self._volume:
             bar = Bar(time, price, price, price, price, size, 1)
-            self.bars.append(bar)
+            bars.append(bar)
         else:
-            bar = self.bars[-1]
-            bar.high = max(bar.high, price)
-            bar.low = min(bar.low, price)
+            if price > bar.high:
+                bar.high = price
+            elif price < bar.low:
+                bar.low = price
             bar.close = price
             bar.volume += size
             bar.count += 1
         if bar.volume >= self._volume:
-            self.bars.updateEvent.emit(self.bars, True)
-            self.emit(self.bars)
\ No newline at end of file
+            bars.updateEvent.emit(bars, True)
+            self.emit(bars)
\ No newline at end of file
@@ -1178,16 +1178,8 @@ class Wrapper:
                 # invalid position requested for removal, so ignore the request
                 pass
 
-        # To retain the original API structure, we convert all sorted dict
-        # values into lists for users to consume.
-        # Users can also read ticker.domBidsDict or ticker.domAsksDict directly.
-        values = list(dom.values())
-        if side:
-            # Update BID for users
-            ticker.domBids = values
-        else:
-            # Update ASK for users
-            ticker.domAsks = values
+        # The dicts are the only DOM store; ticker.domBids and ticker.domAsks
+        # build their lists from them when read.
 
         # TODO: add optional debugging check. In a correctly working system, we should
         #       technically always have sequential bid and ask position entries, but
@@ -1460,14 +1452,12 @@ class Wrapper:
                 # clear all DOM levels
                 ticker.domTicks += [
                     MktDepthData(self.lastTime, 0, "", 2, 0, level.price, 0)
-                    for level in ticker.domAsks
+                    for level in ticker.domAsksDict.values()
                 ]
                 ticker.domTicks += [
                     MktDepthData(self.lastTime, 0, "", 2, 1, level.price, 0)
-                    for level in ticker.domBids
+                    for level in ticker.domBidsDict.values()
                 ]
-                ticker.domAsks.clear()
-                ticker.domBids.clear()
                 ticker.domBidsDict.clear()
                 ticker.domAsksDict.clear()
                 self.pendingTickers.add(ticker)